@@ -1 +1,14 @@
-from .alexdata import *
\ No newline at end of file
+"""
+AlexanderData
+=============
+Braids, Braid Kernels and their Alexander Data.
+
+"""
+
+from .alexdata import Braid, Braid_Kernel
+
+
+__all__ = [
+    "Braid",
+    "Braid_Kernel"
+]
@@ -0,0 +1,173 @@
+"""
+Command Line Interface
+======================
+Streams kernel specs through the Braid_Kernel pipeline, see
+python -m alexdata --help.
+
+Specs are read line by line from files, or stdin, as JSONL
+({"n": 5, "k": 1, "ops": [3, 2, ...]}) or CSV (n,k,ops with the ops
+space separated), and one result per spec is written to stdout, as
+JSONL or CSV, as soon as it is ready. Each result's "index" is the
+line number of its spec, counted across every input file, and lines
+that cannot be parsed get an "error" result of their own. Matplotlib is
+never imported.
+
+"""
+
+# Dependent Libraries
+import argparse
+import csv
+import fileinput
+import json
+import sys
+from collections import deque
+
+from .batch import STAGES, compute, parse_spec
+
+
+__all__ = [
+    "main"
+]
+
+
+def _read(paths, format, lines, errors):
+    """
+    Protected Function
+    Lazily yields specs from files, "-" being stdin.
+
+    Parameters
+    ----------
+    paths : list
+        Spec files.
+    format : "jsonl", "csv" or None
+        Spec format, by file suffix if None.
+    lines : dict
+        Filled with the line number of each spec yielded, by its
+        position in the stream.
+    errors : collections.deque
+        Filled with an error record for each line that cannot be
+        parsed.
+
+    """
+    count = 0
+    source = fileinput.input(paths or ["-"])
+    for line in source:
+        if not line.strip():
+            continue
+        fmt = format
+        if fmt is None:
+            fmt = "csv" if source.filename().endswith(".csv") else "jsonl"
+        try:
+            if fmt == "csv":
+                row = next(csv.reader([line]))
+                if row[0].strip().lower() == "n":
+                    # Header
+                    continue
+                spec = parse_spec((row[0], row[1], row[2].split() if len(row) > 2 else []))
+            else:
+                spec = parse_spec(json.loads(line))
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            errors.append({"index": source.lineno(), "spec": None, "status": "error", "result": None,
+                           "error": source.filename() + ":" + str(source.filelineno()) + ": " + type(e).__name__
+                           + ": " + str(e)})
+            continue
+        lines[count] = source.lineno()
+        count += 1
+        yield spec
+
+
+def _serialise(result):
+    """
+    Protected Function
+    JSON-ready form of a stage's result: SymPy objects and matrices as
+    strings, or nested lists of strings.
+    """
+    if result is None or isinstance(result, (bool, int, float, str)):
+        return result
+    if isinstance(result, dict):
+        return {key: _serialise(value) for key, value in result.items()}
+    if isinstance(result, (list, tuple)):
+        return [_serialise(value) for value in result]
+    if hasattr(result, "to_sympy"):
+        result = result.to_sympy()
+    if hasattr(result, "tolist"):
+        return [[str(e) for e in row] for row in result.tolist()]
+    return str(result)
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "alexdata",
+                                     description = "Computes Braid_Kernel pipeline stages for a stream of kernel specs.")
+    parser.add_argument("files", nargs = "*", help = "JSONL or CSV spec files, stdin if none or '-'")
+    parser.add_argument("--stage", choices = STAGES, default = "data", help = "last pipeline stage to run")
+    parser.add_argument("--jobs", type = int, default = None, help = "worker processes")
+    parser.add_argument("--timeout", type = float, default = None, help = "seconds allowed per kernel")
+    parser.add_argument("--chunksize", type = int, default = 1, help = "kernels sent to a worker at once")
+    parser.add_argument("--unordered", action = "store_true", help = "write results as they complete")
+    parser.add_argument("--input-format", choices = ("jsonl", "csv"), default = None,
+                        help = "spec format, by file suffix if not given, otherwise jsonl")
+    parser.add_argument("--output-format", choices = ("jsonl", "csv"), default = "jsonl")
+    parser.add_argument("--backend", choices = ("sympy", "laurent"), default = "laurent",
+                        help = "reduced Burau backend")
+    parser.add_argument("--method", choices = ("sympy", "bareiss", "modular"), default = "bareiss",
+                        help = "determinant method")
+    parser.add_argument("--truncate", action = "store_true",
+                        help = "only compute the determinant terms the Alexander Data reads")
+    parser.add_argument("--cache", default = None, help = "path of a persistent result cache")
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.stage != "labels":
+        options["backend"] = args.backend
+    if args.stage in ("polynomial", "data"):
+        options["method"] = args.method
+    if args.stage == "data" and args.truncate:
+        options["truncate"] = True
+
+    lines = {}
+    errors = deque()
+    records = compute(_read(args.files, args.input_format, lines, errors), jobs = args.jobs, chunksize = args.chunksize,
+                      ordered = not args.unordered, timeout = args.timeout, stage = args.stage, cache = args.cache,
+                      **options)
+
+    out = sys.stdout
+    writer = None
+    if args.output_format == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["index", "n", "k", "ops", "status", "result", "error"])
+
+    def write(record):
+        if record["spec"] is None:
+            n = k = ops = None
+        else:
+            n, k, ops = record["spec"]
+            ops = list(ops)
+        result = _serialise(record["result"])
+        if writer is None:
+            out.write(json.dumps({"index": record["index"], "n": n, "k": k, "ops": ops,
+                                  "status": record["status"], "result": result, "error": record["error"]}) + "\n")
+        else:
+            writer.writerow([record["index"], n, k, "" if ops is None else " ".join(map(str, ops)), record["status"],
+                             "" if result is None else json.dumps(result), record["error"] or ""])
+        out.flush()
+        return record["status"] != "ok"
+
+    failed = 0
+    try:
+        for record in records:
+            record["index"] = lines.pop(record["index"])
+            # Unparsable lines are written in line order, when ordered
+            while errors and (args.unordered or errors[0]["index"] < record["index"]):
+                failed += write(errors.popleft())
+            failed += write(record)
+        while errors:
+            failed += write(errors.popleft())
+    except BrokenPipeError:
+        # Downstream closed early, e.g. "| head"
+        sys.stderr.close()
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
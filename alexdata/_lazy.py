@@ -0,0 +1,47 @@
+"""
+Lazy Imports
+============
+Defers importing heavy optional libraries (SymPy, Matplotlib) until
+they are first used, so that workers and command line invocations that
+never reach a symbolic stage or a drawing do not pay for them.
+
+"""
+
+# Dependent Libraries
+import importlib
+
+
+__all__ = []
+
+
+class _Lazy_Module():
+    """
+    Protected Class
+    Stands in for a module, importing it on first attribute access.
+    """
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        return "<lazy module '" + self._name + "'>"
+
+
+def _pyplot():
+    """
+    Protected Function
+    Imports matplotlib.pyplot, for interactive figures. Figures for
+    files and buffers are built without it, see render.new_figure().
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
+
+sp = _Lazy_Module("sympy")
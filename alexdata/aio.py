@@ -0,0 +1,378 @@
+"""
+Asyncio Service
+===============
+Awaitable Braid_Kernel pipeline, for event loops that must not block.
+
+Every computation runs in a managed pool of worker processes, so the
+event loop stays free. A computation that is cancelled, or overruns its
+time budget, has its worker killed and replaced: a pathological kernel
+is actually stopped, not left running in the background. Identical
+requests in flight at the same time share one computation, and once
+every worker is busy only a bounded number of computations may queue,
+further ones being refused at once with Service_Busy.
+
+For example:
+```
+from alexdata import aio
+
+U, V, data = await aio.alexander_data(5, 1, [3, 2, 2, -4, -1, -1, -2, -3, -4], timeout = 10)
+```
+
+Notes
+-----
+Workers are watched with the event loop's add_reader(), which the
+default event loop supports on Unix only. Workers are not forked from
+the calling process, so, as for any multiprocessing program, scripts
+using the service must guard their entry point with
+`if __name__ == "__main__":`.
+
+"""
+
+# Dependent Libraries
+import asyncio
+import multiprocessing
+import os
+import signal
+
+from .batch import STAGES, _run_stage, parse_spec
+from .cache import Result_Cache
+
+
+__all__ = [
+    "Kernel_Service",
+    "Service_Busy",
+    "alexander_data",
+    "alexander_polynomial",
+    "reduced_burau",
+    "shutdown"
+]
+
+
+class Service_Busy(RuntimeError):
+    """
+    Raised when a Kernel_Service's queue is full.
+    """
+
+
+def _serve(conn):
+    """
+    Protected Function
+    Main loop of a worker process: runs each (spec, stage, options,
+    cache) request received and sends back ("ok", result) or ("error",
+    exception).
+    """
+    # Interrupts are the parent's to handle
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            spec, stage, options, cache = conn.recv()
+        except EOFError:
+            return
+        try:
+            if cache is None:
+                reply = ("ok", _run_stage(spec, stage, options))
+            else:
+                reply = ("ok", cache.fetch(spec, stage, options, lambda: _run_stage(spec, stage, options)))
+        except Exception as e:
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send(("error", RuntimeError(type(e).__name__ + ": " + str(e))))
+
+
+class _Worker():
+    """
+    A worker process and the parent's end of its pipe.
+    """
+    def __init__(self, context):
+        self.context = context
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target = _serve, args = (child,), daemon = True)
+        self.process.start()
+        child.close()
+
+    async def call(self, request):
+        """
+        Sends a request and waits, without blocking the event loop, for
+        the reply.
+        """
+        self.conn.send(request)
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fd = self.conn.fileno()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            raise RuntimeError("Worker process exited with code " + str(self.process.exitcode) + ".") from None
+
+    def kill(self):
+        """
+        Kills the process, whatever it is doing.
+        """
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+
+class Kernel_Service():
+    """
+    Pool of worker processes serving Braid_Kernel pipeline requests to
+    asyncio code.
+
+    Parameters
+    ----------
+    workers : int or None (Default = None)
+        Worker processes; None uses one per CPU.
+    max_pending : int (Default = 64)
+        Computations that may wait for a free worker. Requests beyond
+        it raise Service_Busy.
+    timeout : float or None (Default = None)
+        Time budget, in seconds, of every computation, however long its
+        callers are willing to wait.
+    cache : Result_Cache or str or os.PathLike or None (Default = None)
+        Persistent result cache shared by the workers, see batch.compute().
+
+    Notes
+    -----
+    Worker processes are started on the first request, with the
+    "forkserver" start method where available, so that they do not
+    inherit the event loop. Use the service as an async context manager,
+    or call close(), to stop them.
+
+    """
+    def __init__(self, workers = None, max_pending = 64, timeout = None, cache = None):
+        if workers is not None and workers < 1:
+            raise ValueError("A service needs at least one worker.")
+        if max_pending < 0:
+            raise ValueError("Pending limit cannot be negative.")
+        if cache is not None and not isinstance(cache, Result_Cache):
+            cache = Result_Cache(cache)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.cache = cache
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._idle = None
+        self._pool = []
+        self._inflight = {}
+        self._closing = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def pending(self):
+        """
+        Number of distinct computations running or queued.
+        """
+        return len(self._inflight)
+
+    def _start(self):
+        """
+        Protected Method
+        Starts the worker processes, on the first request.
+        """
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self.workers):
+                self._replace(None)
+
+    def _replace(self, worker):
+        """
+        Protected Method
+        Kills a worker, if any, and puts a fresh one in the idle queue,
+        unless the service is closing.
+        """
+        if worker is not None:
+            worker.kill()
+            self._pool.remove(worker)
+        if self._closing:
+            return
+        worker = _Worker(self._context)
+        self._pool.append(worker)
+        self._idle.put_nowait(worker)
+
+    async def _compute(self, key, request):
+        """
+        Protected Method
+        Runs a request on the next free worker, within the service's
+        time budget. A worker interrupted mid-request is replaced.
+        """
+        try:
+            worker = await self._idle.get()
+            try:
+                status, value = await asyncio.wait_for(worker.call(request), self.timeout)
+            except BaseException:
+                self._replace(worker)
+                raise
+            self._idle.put_nowait(worker)
+        finally:
+            # run() drops the entry itself when it cancels the task
+            entry = self._inflight.get(key)
+            if entry is not None and entry[0] is asyncio.current_task():
+                del self._inflight[key]
+        if status == "error":
+            raise value
+        return value
+
+    async def run(self, n, k, ops, stage = "data", timeout = None, **options):
+        """
+        Runs a stage of the pipeline for a kernel.
+
+        Parameters
+        ----------
+        n : int
+            Braid group.
+        k : int
+            Number of caps.
+        ops : sequence of int
+            Braid word.
+        stage : str (Default = "data")
+            Pipeline stage, see batch.STAGES.
+        timeout : float or None (Default = None)
+            Seconds this caller waits. The computation is stopped once
+            no caller is waiting for it.
+        **options
+            Passed on to the stage's Braid_Kernel method, e.g.
+            method = "bareiss".
+
+        Returns
+        -------
+        result
+            The stage's result, as from batch.compute().
+
+        Raises
+        ------
+        TimeoutError
+            The timeout, or the service's time budget, ran out.
+        Service_Busy
+            Too many computations are already queued.
+
+        """
+        if stage not in STAGES:
+            raise ValueError("Unknown stage '" + str(stage) + "', use one of " + str(STAGES) + ".")
+        spec = parse_spec((n, k, ops))
+        self._start()
+
+        key = Result_Cache.key(*spec, stage, **options)
+        entry = self._inflight.get(key)
+        if entry is None:
+            if len(self._inflight) >= self.workers + self.max_pending:
+                raise Service_Busy("Service is at capacity, " + str(len(self._inflight)) + " computations pending.")
+            entry = self._inflight[key] = [None, 0]
+            entry[0] = asyncio.ensure_future(self._compute(key, (spec, stage, options, self.cache)))
+        task = entry[0]
+
+        entry[1] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError("Kernel exceeded its time budget.") from None
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                # Dropped at once, so that a new identical request starts
+                # afresh rather than joining the cancelled computation
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+                task.cancel()
+
+    async def reduced_burau(self, n, k, ops, timeout = None, **options):
+        """
+        Reduced Burau matrix of a kernel, see Braid_Kernel.reduced_burau()
+        and run().
+        """
+        return await self.run(n, k, ops, "burau", timeout, **options)
+
+    async def alexander_polynomial(self, n, k, ops, timeout = None, **options):
+        """
+        Alexander polynomial of a kernel, see
+        Braid_Kernel.alexander_polynomial() and run().
+        """
+        return await self.run(n, k, ops, "polynomial", timeout, **options)
+
+    async def alexander_data(self, n, k, ops, timeout = None, **options):
+        """
+        (U, V, data) of a kernel, see Braid_Kernel.alexander_data() and
+        run().
+        """
+        result = await self.run(n, k, ops, "data", timeout, **options)
+        return result["U"], result["V"], result["data"]
+
+    async def close(self):
+        """
+        Cancels every computation and stops the workers.
+        """
+        self._closing = True
+        try:
+            tasks = [entry[0] for entry in self._inflight.values()]
+            self._inflight = {}
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+            for worker in self._pool:
+                worker.kill()
+            self._pool = []
+            self._idle = None
+        finally:
+            self._closing = False
+
+
+# Service behind the module level functions
+_service = None
+
+
+def _default():
+    """
+    Protected Function
+    Returns the module's shared Kernel_Service, creating it on first use.
+    """
+    global _service
+    if _service is None:
+        _service = Kernel_Service()
+    return _service
+
+
+async def reduced_burau(n, k, ops, timeout = None, **options):
+    """
+    Reduced Burau matrix of a kernel, on the shared service, see
+    Kernel_Service.run().
+    """
+    return await _default().reduced_burau(n, k, ops, timeout, **options)
+
+
+async def alexander_polynomial(n, k, ops, timeout = None, **options):
+    """
+    Alexander polynomial of a kernel, on the shared service, see
+    Kernel_Service.run().
+    """
+    return await _default().alexander_polynomial(n, k, ops, timeout, **options)
+
+
+async def alexander_data(n, k, ops, timeout = None, **options):
+    """
+    (U, V, data) of a kernel, on the shared service, see
+    Kernel_Service.run().
+    """
+    return await _default().alexander_data(n, k, ops, timeout, **options)
+
+
+async def shutdown():
+    """
+    Stops the shared service's workers.
+    """
+    global _service
+    if _service is not None:
+        await _service.close()
+        _service = None
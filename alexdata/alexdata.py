@@ -12,12 +12,23 @@ specifically the Braid Kernel, a representation of repeating
 textile structures. From this object the user can calculate the
 entire Alexander Data, or each of the internel stages piece-meal.
 
+The module is part of the alexdata package, so its example below runs
+with `python -m alexdata.alexdata` rather than as a script; kernel
+specs are streamed through the pipeline with `python -m alexdata`.
+
 """
 
 # Dependent Libraries
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+
 import numpy as np
-import sympy as sp
-import matplotlib.pyplot as plt
+
+from ._lazy import _pyplot, sp
+from .instrument import Instrument
+from .laurent import Laurent_Ring, Laurent_Matrix
+from .modular import modular_det
+from .render import braid_geometry, frame_figure, new_figure, save_figure, strand_collection, word_title
 
 
 __all__ = [
@@ -26,12 +37,84 @@ __all__ = [
 ]
 
 
+def _word_dtype(n):
+    """
+    Protected Function
+    Smallest NumPy integer type able to hold every operation, and
+    every strand label, of a braid on n strands.
+    """
+    return np.int16 if n < 2**15 else np.int32
+
+
+def _reduce_word(ops, cyclic = False):
+    """
+    Protected Function
+    Freely reduces a braid word and puts it in commutation normal form.
+
+    Parameters
+    ----------
+    ops : list
+        Sequence of Artin operators.
+    cyclic : boolean (Default = False)
+        Also cancels operations at the two ends of the word that are
+        inverse to one another, i.e. conjugates the braid.
+
+    Returns
+    -------
+    ops : list
+        The reduced word.
+
+    Notes
+    -----
+    Operations are pushed onto the reduced word one at a time. Each is
+    cancelled against the nearest inverse operation that every
+    operation after it far-commutes with (|i - j| >= 2), if any, and is
+    otherwise moved back past every far-commuting operation that sorts
+    after it. Cancelling can free earlier operations to move, so passes
+    repeat until the word is stable.
+
+    """
+    def order(op):
+        return (abs(op), op)
+
+    while True:
+        out = []
+        for op in ops:
+            g = abs(op)
+            p = len(out)
+            # Search the far-commuting tail for an inverse
+            while p > 0 and (abs(abs(out[p - 1]) - g) >= 2 or out[p - 1] == -op):
+                if out[p - 1] == -op:
+                    break
+                p -= 1
+            if p > 0 and out[p - 1] == -op:
+                del out[p - 1]
+                continue
+            # Sort into the far-commuting tail
+            p = len(out)
+            while p > 0 and abs(abs(out[p - 1]) - g) >= 2 and order(out[p - 1]) > order(op):
+                p -= 1
+            out.insert(p, op)
+
+        if cyclic:
+            while len(out) > 1 and out[0] == -out[-1]:
+                out = out[1:-1]
+        if out == ops:
+            return out
+        ops = out
+
+
 class Braid():
     """
     Initialises the Braid class object, including calling
     the internal tracking function to generate strand positions.
     """
-    def __init__(self, n, *ops):
+    __slots__ = ("braid_group", "_word", "_labels", "top_labels", "original_length")
+
+    # Size, in inches, of drawn figures
+    _figsize = (4, 8)
+
+    def __init__(self, n, *ops, reduce = False):
         """
         Braid class object with internel starnd tracking and drawing
         functionality.
@@ -43,36 +126,174 @@ class Braid():
         braid_word : list
             Sequence of Artin operators that define the braid 
             (Negative values indicate undercrossing strands).
+        word : numpy.ndarray
+            The braid word's contiguous integer buffer.
         
         undercrossing_labels : list
             List of underscrossing strands' labels for each 
             Artin operation repectively.
+        original_length : int or None
+            Length of the braid word before reduce(), or None if it has
+            not been reduced.
         
         Notes
         -----
-        abcd
+        The braid word and the undercrossing labels are held in compact
+        NumPy integer buffers; braid_word and undercrossing_labels return
+        them as new lists. Use from_array() or from_buffer() to build a
+        Braid around an existing buffer without copying it.
+        """
+        # Check for invalid braid operation in selected group
+        for op in ops:
+            if op >= n or op <= -n:
+                raise ValueError("Braid operations cannot exceed the containing braid group.")
+        self._store_word(n, np.array(ops, dtype = _word_dtype(n)))
+        if reduce:
+            self.reduce()
+
+    @classmethod
+    def from_array(cls, n, word):
+        """
+        Builds a Braid on n strands around an existing 1-d integer array.
+
+        Parameters
+        ----------
+        n : int
+            The number of strands in the braid.
+        word : array_like
+            Sequence of Artin operators. A C-contiguous NumPy array of a
+            signed integer type at least as wide as the Braid's own (see
+            word) is used as is, without a copy; any other is converted.
+
+        """
+        obj = cls.__new__(cls)
+        obj._set_word(n, word)
+        return obj
+
+    @classmethod
+    def from_buffer(cls, n, buffer, dtype = np.int32):
+        """
+        Builds a Braid on n strands over any object exposing the buffer
+        protocol (bytes, memoryview, mmap, ...), without a copy.
+
+        Parameters
+        ----------
+        n : int
+            The number of strands in the braid.
+        buffer : buffer
+            Raw Artin operators, native byte order.
+        dtype : NumPy integer type (Default = numpy.int32)
+            Integer type the buffer holds.
+
+        """
+        return cls.from_array(n, np.frombuffer(buffer, dtype = dtype))
+
+    def _set_word(self, n, word):
+        """
+        Protected Method
+        Validates an array braid word, casting it to a signed type wide
+        enough for the Braid if it is not one already, then stores it.
+        """
+        word = np.asarray(word)
+        if word.ndim != 1 or word.dtype.kind not in "iu":
+            raise ValueError("Braid word must be a 1-d sequence of integers.")
+
+        # Check for invalid braid operation in selected group
+        if np.any((word >= n) | (word <= -n)):
+            raise ValueError("Braid operations cannot exceed the containing braid group.")
+        dtype = _word_dtype(n)
+        if word.dtype.kind != "i" or word.dtype.itemsize < np.dtype(dtype).itemsize:
+            word = word.astype(dtype)
+        self._store_word(n, np.ascontiguousarray(word))
+
+    def _store_word(self, n, word):
+        """
+        Protected Method
+        Stores a validated braid word, then tracks the strands.
         """
         # Establish Group/No. of Strands
+        self.original_length = None
         self.braid_group = n
+        self._word = word
+        self._labels = np.array(self._track_strands(), dtype = _word_dtype(n))
 
-        # BraidWord and tracked strands developed at the same time
-        self.braid_word = []
-        for i in ops:
-            # Check for invalid braid operation in selected group
-            if abs(i) >= n:
-                raise ValueError("Braid operations cannot exceed the containing braid group.")
-            # Build braid word
-            self.braid_word.append(i)
+    @property
+    def word(self):
+        """
+        The braid word's integer buffer, as a read-only view.
+        """
+        view = self._word.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def braid_word(self):
+        """
+        Sequence of Artin operators that define the braid, as a list.
+        """
+        return self._word.tolist()
+
+    @property
+    def undercrossing_labels(self):
+        """
+        Undercrossing strand label of each Artin operation, as a list.
+        """
+        return self._labels.tolist()
+
+    @property
+    def shrinkage(self):
+        """
+        Fraction of the braid word removed by reduce(), 0 if it has not
+        been reduced.
+        """
+        if not self.original_length:
+            return 0.0
+        return 1 - len(self._word) / self.original_length
+
+    def reduce(self, cyclic = False):
+        """
+        Shortens the braid word, in place, without changing the braid.
+
+        Parameters
+        ----------
+        cyclic : boolean (Default = False)
+            Also cancels inverse operations at the two ends of the word,
+            which conjugates the braid but keeps its closure.
 
-        self.undercrossing_labels = self._track_strands()
+        Returns
+        -------
+        self : Braid
+            The reduced Braid.
+
+        Notes
+        -----
+        Cancels adjacent inverse pairs, also across far-commuting
+        operations, and sorts far-commuting runs into a fixed order, see
+        _reduce_word(). The undercrossing labels are retracked, and the
+        original length is kept in original_length.
+
+        """
+        length = self.original_length or len(self._word)
+        word = _reduce_word(self.braid_word, cyclic)
+        if word != self.braid_word:
+            self._store_word(self.braid_group, np.array(word, dtype = self._word.dtype))
+        self.original_length = length
+        return self
+
+    @property
+    def bot_labels(self):
+        """
+        Strand labels at the end, or 'bottom', of the braid.
+        """
+        return list(range(1, self.braid_group + 1))
 
     def _track_strands(self):
         """
         Protected Method
         Tracks starnd positions through the given braid.
 
-        top_labels : list
-            List of 'briad_group' length, indicating strand
+        top_labels : tuple
+            Tuple of 'briad_group' length, indicating strand
             names / labels present at the start, or 'top', 
             of the braid. (Tracked internally from sequence
             of operations)
@@ -93,27 +314,26 @@ class Braid():
         'bottom' of the braid up as is the set convention for labelling
         used by Professor Morton in his work.
         """
+        word = self._word.tolist()
+
         # Initial Positions (AT BOTTOM)
-        label_positions = [i + 1 for i in range(self.braid_group)]
-        self.bot_labels = label_positions
+        label_positions = list(range(1, self.braid_group + 1))
 
-        undercrossing_labels = []
+        labels = [0] * len(word)
         # Going through artin opertaors backwards (i.e. from bottom of braid)
-        for op in reversed(self.braid_word):
-            index = abs(op) - 1
+        for c in range(len(word) - 1, -1, -1):
+            op = word[c]
+            # Left position of the crossing
+            i = abs(op) - 1
             # Grab undercrossing string
-            if np.sign(op) == -1:
-                undercrossing_labels.append(label_positions[index + 1])
-            else:
-                undercrossing_labels.append(label_positions[index])
+            labels[c] = label_positions[i + 1 if op < 0 else i]
             # Swap
-            label_positions[index], label_positions[index + 1] = label_positions[index + 1], label_positions[index]
+            label_positions[i], label_positions[i + 1] = label_positions[i + 1], label_positions[i]
 
         # Final Positions (AT TOP)
-        self.top_labels = label_positions
+        self.top_labels = tuple(label_positions)
 
-        undercrossing_labels.reverse()
-        return undercrossing_labels
+        return labels
 
     def draw(self, style = "comp", linewidth = 3, gap_size = 3, color = "rainbow", save = False):
         """
@@ -140,82 +360,81 @@ class Braid():
                 'y': yellow,
                 'k': black,
                 'w': white}
+        save : boolean or str (Default = False)
+            Saves the figure, to "test.svg" if True or to the given
+            path, with render() instead of showing it.
 
         Notes
         -----
         abcd
 
+        """
+        if save:
+            self.render("test.svg" if save is True else save, style = style, linewidth = linewidth,
+                        gap_size = gap_size, color = color)
+            return
+
+        plt = _pyplot()
+        fig = plt.figure(figsize = self._figsize)
+        self._plot(fig, style, linewidth, gap_size, color)
+        plt.show()
+
+    def render(self, target = None, format = None, style = "comp", linewidth = 3, gap_size = 3, color = "rainbow",
+               dpi = 100, figsize = None):
+        """
+        Renders the Braid without a display, see draw().
+
+        Parameters
+        ----------
+        target : str, os.PathLike, file object or None (Default = None)
+            Path or binary file object to write to. None returns the
+            image as bytes.
+        format : "png", "svg", "pdf", ... or None (Default = None)
+            Image format, taken from the path's suffix if not given,
+            otherwise "png".
+        style, linewidth, gap_size, color
+            See draw().
+        dpi : int (Default = 100)
+            Resolution of raster formats.
+        figsize : tuple or None (Default = None)
+            Figure size in inches, the same as draw() if None.
+
+        Returns
+        -------
+        image : bytes or None
+            The encoded image if no target was given.
+
+        Notes
+        -----
+        The figure is built without pyplot, so no global figure state is
+        touched and concurrent renders are safe; it is freed once saved.
+
+        """
+        fig = new_figure(figsize or self._figsize)
+        self._plot(fig, style, linewidth, gap_size, color)
+        return save_figure(fig, target, format, dpi)
+
+    def _plot(self, fig, style, linewidth, gap_size, color):
+        """
+        Protected Method
+        Draws the Braid onto a MatPlotLib figure.
         """
         n = self.braid_group
-        braid = self.braid_word
-
-        fig, ax = plt.subplots(figsize = (4, 8))
-
-        t = np.arange(0, 1.05, 0.05)
-
-        # line break
-        lb = np.array([[np.NaN, np.NaN]])
-
-        x = 0
-        layer = []
-
-        strands = [np.empty((0, 2)) for _ in range(n)]
-
-        # Start positons
-        for s in range(1, n + 1):
-            S = np.array([[s], [0]]).T
-            strands[s - 1] = np.concatenate((strands[s - 1], S))
-
-        # Calc crossing points
-        for count, op in enumerate(braid):
-            i = abs(op)
-
-            if style == "comp":
-                if i in layer or i + 1 in layer:
-                    layer = []
-                    x += 2
-                layer.append(i)
-                layer.append(i + 1)
-
-            # Crossing Matrices
-            R1 = np.array([0.5*t**2 + i, -t - x]).T
-            R2 = np.array([-0.5*t**2 + 1 + i, t - 2 - x]).T
-            L1 = np.array([-0.5*t**2 + 1 + i, -t - x]).T
-            L2 = np.array([0.5*t**2 + i, t - 2 - x]).T
-
-            if np.sign(op) == 1:    # overcrossing
-                strands[i - 1] = np.concatenate((strands[i - 1], R1, np.flipud(R2)))
-                strands[i] = np.concatenate((strands[i], L1[:-gap_size, :], lb, np.flipud(L2[:-gap_size, :])))
-            elif np.sign(op) == -1:     # undercrossing
-                strands[i - 1] = np.concatenate((strands[i - 1], R1[:-gap_size, :], lb, np.flipud(R2[:-gap_size, :])))
-                strands[i] = np.concatenate((strands[i], L1, np.flipud(L2)))
-            
-            # swap lines for each operation
-            strands[i - 1], strands[i] = strands[i], strands[i - 1]
-
-            if style == "ext" or count + 1 == len(braid):
-                x += 2
-
-        # End positons
-        for s in range(1, n + 1):
-            S = np.array([[s], [-(x)]]).T
-            strands[s - 1] = np.concatenate((strands[s - 1], S))
-            if color == "rainbow":
-                ax.plot(strands[s - 1][:, 0], strands[s - 1][:, 1], lw = linewidth)
-            else:
-                ax.plot(strands[s - 1][:, 0], strands[s - 1][:, 1], lw = linewidth, c = color)
 
-        # Figure Details
-        fig.suptitle("Braid:   " + str(braid))
-        ax.axis("off")
-        ax.set_aspect(2*n / x)
-        plt.tight_layout()
+        ax = fig.subplots()
+        paths, x = braid_geometry(n, self._word, style, gap_size)
 
-        # SAVE CHECK
-        if save:
-            plt.savefig("test.svg")
+        if color == "rainbow":
+            colors = ["C" + str(s) for s in range(n)]
         else:
-            plt.show()
+            colors = [color] * n
+        ax.add_collection(strand_collection(paths, colors, linewidth))
+        ax.autoscale_view()
+
+        # Figure Details
+        frame_figure(fig, "Braid:   " + word_title(self._word))
+        ax.axis("off")
+        ax.set_aspect(2*n / max(x, 1))
 
     def __str__(self):
         """
@@ -234,25 +453,185 @@ class Braid_Kernel(Braid):
     ----------
     (See parent class of Braid for braid specific attributes.)
 
-    eq : list[list]
-        List of equivalence classes for strand labels, detailing the
-        strands that connect to one another through loops of the Kernel.
+    eq : tuple[tuple]
+        Equivalence classes for strand labels, each a tuple of (label,
+        direction) pairs, detailing the strands that connect to one
+        another through loops of the Kernel.
 
     Notes
     -----
     abcd
 
     """
-    def __init__(self, n, k, *ops):
+    __slots__ = ("caps", "eq", "_cache", "_y_strands", "_instrument")
+
+    # Size, in inches, of drawn figures
+    _figsize = (6, 8)
+
+    def __init__(self, n, k, *ops, reduce = False):
         """
         Initialises the Braid_Kernel class object with internal strand
         tracking through the braid and around the loops of teh Kernel. 
         """
+        self._set_caps(n, k)
+        self._instrument = None
+        super().__init__(n, *ops, reduce = reduce)
+
+    @classmethod
+    def from_array(cls, n, k, word):
+        """
+        Builds a Braid_Kernel on n strands with k caps around an existing
+        1-d integer array, without a copy, see Braid.from_array().
+        """
+        obj = cls.__new__(cls)
+        obj._set_caps(n, k)
+        obj._instrument = None
+        obj._set_word(n, word)
+        return obj
+
+    @classmethod
+    def from_buffer(cls, n, k, buffer, dtype = np.int32):
+        """
+        Builds a Braid_Kernel on n strands with k caps over a raw buffer,
+        without a copy, see Braid.from_buffer().
+        """
+        return cls.from_array(n, k, np.frombuffer(buffer, dtype = dtype))
+
+    def _store_word(self, n, word):
+        """
+        Protected Method
+        Stores a new braid word, dropping every cached stage result.
+        """
+        self._cache = None
+        self._y_strands = None
+        super()._store_word(n, word)
+
+    def clear_cache(self):
+        """
+        Drops every cached stage result of the Alexander pipeline.
+
+        Notes
+        -----
+        Each stage (reduced Burau matrix, its modified matrix, the
+        determinant, U and V, the substituted determinant and the
+        Alexander Data) is computed once per braid word and kept on the
+        Kernel; reducing the word clears them automatically.
+        A Kernel built with from_array() over an array that is later
+        modified in place must be cleared by hand.
+
+        """
+        self._cache = None
+
+    def _cached(self, key, build):
+        """
+        Protected Method
+        Returns the cached result for key, building and storing it with
+        build() the first time. The cache itself is only created then.
+        """
+        if self._cache is None:
+            self._cache = {}
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+        if self._instrument is not None:
+            self._instrument.cached(key[0])
+        return value
+
+    @contextmanager
+    def instrument(self, callback = None, memory = False, count_ops = False, crossings = True):
+        """
+        Emits structured events from every pipeline stage run on the
+        Kernel within a with block.
+
+        Parameters
+        ----------
+        callback : callable or None (Default = None)
+            Called with each event as it happens.
+        memory : boolean (Default = False)
+            Traces memory, so events carry memory deltas.
+        count_ops : boolean (Default = False)
+            Adds SymPy's count_ops() of each stage's result.
+        crossings : boolean (Default = True)
+            Emits an event for every crossing of the Burau accumulation,
+            with the terms of the unexpanded product.
+
+        Yields
+        ------
+        probe : Instrument
+            Its 'events' list holds every event emitted.
+
+        Notes
+        -----
+        See the instrument module for the events. Stages run over a
+        process pool are timed as a whole. For example:
+        ```
+        with kernel.instrument(print):
+            kernel.alexander_data(print_result = False)
+        ```
+
+        """
+        probe = Instrument(callback, memory, count_ops, crossings)
+        previous = self._instrument
+        self._instrument = probe
+        probe.start()
+        try:
+            yield probe
+        finally:
+            probe.stop()
+            self._instrument = previous
+
+    def _stage(self, name, **fields):
+        """
+        Protected Method
+        Context measuring a pipeline stage when the Kernel is
+        instrumented, see Instrument.stage().
+        """
+        if self._instrument is None:
+            return nullcontext({})
+        return self._instrument.stage(name, **fields)
+
+    def _measured(self, name, build, **fields):
+        """
+        Protected Method
+        Returns build(), run as the pipeline stage 'name', see _stage().
+        """
+        with self._stage(name, **fields) as record:
+            record["result"] = build()
+        return record["result"]
+
+    def reduce(self, cyclic = False):
+        """
+        Shortens the braid word, in place, without changing the braid,
+        see Braid.reduce().
+
+        Notes
+        -----
+        Free reduction and far commutation leave the reduced Burau
+        matrix, and so the Alexander polynomial, exactly unchanged. The
+        strands crossing the "y" strand, which V is built from, are read
+        off the word before it is reduced. Cyclic reduction is not
+        allowed: the caps and the "y" strand pin the ends of the braid,
+        so conjugating it changes the Kernel.
+
+        """
+        if cyclic:
+            raise ValueError("A Braid_Kernel cannot be cyclically reduced.")
+        strands = self._y_crossings()
+        super().reduce()
+        self._y_strands = strands
+        return self
+
+    def _set_caps(self, n, k):
+        """
+        Protected Method
+        Validates and stores the number of caps.
+        """
         # Check Valid k input:
         if k > n / 2:
             raise ValueError("Number of caps cannot exceed half of total number of strands.")
         self.caps = k
-        super().__init__(n, *ops)
 
     def _track_strands(self):
         """
@@ -280,18 +659,23 @@ class Braid_Kernel(Braid):
         k = self.caps
 
         end_pos = self.top_labels
+        # Inverse permutation: index of each label in end_pos
+        inverse = [0] * n
+        for index, label in enumerate(end_pos):
+            inverse[label - 1] = index
+
         eq = []
-        visited = []
+        visited = bytearray(n)
         for i in range(n):
             same = []
             looped = False
             bot_list = True
             direction = +1
-            while i not in visited or bot_list == False:
+            while not visited[i] or bot_list == False:
                 if bot_list:
                     # Append to same: strand label and direction tuple.
                     same.append((i + 1, direction))
-                    visited.append(i)
+                    visited[i] = 1
                 
                 # If we have done a cap or round the back
                 if not looped:
@@ -310,23 +694,72 @@ class Braid_Kernel(Braid):
                 # Straight Across
                 else:
                     if bot_list:
-                        i = end_pos.index(i + 1)
+                        i = inverse[i]
                     else:
                         i = end_pos[i] - 1
                     bot_list = not bot_list
                     looped = False
 
             if len(same) > 0:
-                eq.append(same)
+                eq.append(tuple(same))
 
-        # Using establlished above equivalences to relabel label list
+        # Using establlished above equivalences to relabel label list,
+        # through each strand's class representative (its first label).
+        rep = list(range(n + 1))
         for l in eq:
-            label_list = [l[0][0] if x in [k[0] for k in l] else x for x in label_list]
+            for s in l:
+                rep[s[0]] = l[0][0]
+        label_list = [rep[label] for label in label_list]
 
-        self.eq = eq
+        self.eq = tuple(eq)
         return label_list
 
-    def reduced_burau(self, print_result = True):
+    def variables(self, x = True):
+        """
+        Names of the variables of the Kernel's Alexander polynomial, in
+        the order used by the numeric and Laurent methods.
+
+        Parameters
+        ----------
+        x : boolean (Default = True)
+            Includes "x". The reduced Burau matrix only depends on the
+            remaining, strand, variables.
+
+        Returns
+        -------
+        names : list
+            "x" (optional), "y", then one "t?" per strand class.
+
+        """
+        strands = ["t" + str(g[0][0]) for g in self.eq if g[0][0] != 1]
+        return (["x"] if x else []) + ["y"] + strands
+
+    def _laurent_ring(self):
+        """
+        Protected Method
+        Builds the Laurent_Ring holding every variable of the Kernel's
+        Alexander polynomial.
+
+        Returns
+        -------
+        ring : Laurent_Ring
+            Ring for the native Laurent backend.
+
+        """
+        return Laurent_Ring(self.variables())
+
+    def _burau_label(self, label, symbol = True):
+        """
+        Protected Method
+        Returns the Burau variable for an undercrossing strand label,
+        either as a SymPy symbol or as the variable's name.
+        """
+        name = "y" if label == 1 else "t" + str(label)
+        if symbol:
+            return sp.symbols(name)
+        return name
+
+    def reduced_burau(self, print_result = True, backend = "sympy", inplace = False, jobs = None):
         """
         Produces the Reduced Burau Matrix for the Braid_Kernel object.
 
@@ -335,11 +768,26 @@ class Braid_Kernel(Braid):
         print_result : boolean (Default = True)
             Prints the final result of this method. Defaulted as True
             so as to be shown if mthod called individually.
+        backend : "sympy" or "laurent" (Default = "sympy")
+            "sympy" builds the matrix from SymPy expressions. "laurent"
+            uses the native sparse Laurent polynomial engine, which is
+            far faster and lighter for large kernels.
+        inplace : boolean (Default = False)
+            Applies each generator to the running product as an O(n)
+            column update, in place, rather than building a generator
+            matrix and taking a full matrix product.
+        jobs : int or None (Default = None)
+            Splits the braid word into segments whose products are taken
+            over a pool of 'jobs' worker processes, then combined with a
+            balanced product tree. 1 builds the tree in this process.
+            None folds the generators in left to right.
 
         Returns
         -------
-        mat : SymPy Matrix
+        mat : SymPy Matrix or Laurent_Matrix
             The reduced Burau Matrix of the current Briad_Kernel object.
+            A Laurent_Matrix is returned for the "laurent" backend, use
+            its to_sympy() method to convert it.
 
         Notes
         -----
@@ -347,49 +795,215 @@ class Braid_Kernel(Braid):
         "y" in line with the Kernel. This means that all fabric specific
         strands within this code are shown as "t2" onwards. 
 
+        """
+        if backend not in ("sympy", "laurent"):
+            raise ValueError("Unknown backend '" + str(backend) + "', use 'sympy' or 'laurent'.")
+
+        def build():
+            with self._stage("burau", backend = backend, jobs = jobs) as record:
+                if jobs is not None:
+                    record["result"] = self._tree_burau(backend, jobs)
+                elif backend == "laurent":
+                    record["result"] = self._laurent_burau(inplace)
+                else:
+                    record["result"] = self._sympy_burau(inplace)
+            return record["result"]
+
+        # The product is the same however it is taken, so only the backend keys it
+        mat = self._cached(("burau", backend), build).copy()
+
+        # Prints Reduced Burau
+        if print_result:
+            if backend == "laurent":
+                sp.pprint(mat.to_sympy())
+            else:
+                sp.pprint(mat.applyfunc(sp.simplify))
+
+        return mat
+
+    def _sympy_burau(self, inplace = False):
+        """
+        Protected Method
+        Reduced Burau Matrix built and multiplied as SymPy matrices.
         """
         mat = sp.eye(self.braid_group)
         label_list = self.undercrossing_labels
+        word = self.braid_word
+        probe = self._instrument
 
         # Going through each operation
-        for i in range(len(self.braid_word)):
+        for i in range(len(word)):
             # Establish sigma and its corresponding label
-            op = self.braid_word[i]
-            if label_list[i] == 1:
-                label = sp.symbols("y")
-            else:
-                label = sp.symbols("t" + str(label_list[i]))
-
-            # idnetity matrix to be turned into burau
-            burau = sp.eye(self.braid_group)
+            op = word[i]
+            label = self._burau_label(label_list[i])
 
-            # Inverse or not check...
-            row = abs(op) - 1
-            if np.sign(op) == -1:
-                if row != 0:
-                    burau[row, row - 1] = label
-                burau[row, row] = -label
-                burau[row, row + 1] = 1
+            if inplace:
+                self._sympy_generator(mat, op, label)
             else:
-                if row != 0:
-                    burau[row, row - 1] = 1
-                burau[row, row] = -label**-1
-                burau[row, row + 1] = label**-1
+                # idnetity matrix to be turned into burau
+                burau = sp.eye(self.braid_group)
+
+                # Inverse or not check...
+                row = abs(op) - 1
+                if np.sign(op) == -1:
+                    if row != 0:
+                        burau[row, row - 1] = label
+                    burau[row, row] = -label
+                    burau[row, row + 1] = 1
+                else:
+                    if row != 0:
+                        burau[row, row - 1] = 1
+                    burau[row, row] = -label**-1
+                    burau[row, row + 1] = label**-1
 
-            # Mulitply each time
-            mat = mat*burau
+                # Mulitply each time
+                mat = mat*burau
+
+            if probe is not None:
+                probe.crossing(i, op, mat)
 
         # Delete last row and column
         mat.row_del(self.braid_group - 1)
         mat.col_del(self.braid_group - 1)
 
-        # Prints Reduced Burau
-        if print_result:
-            sp.pprint(mat.applyfunc(sp.simplify))
+        return mat
+
+    @staticmethod
+    def _sympy_generator(mat, op, label):
+        """
+        Protected Method
+        Right-multiplies the SymPy matrix 'mat', in place, by the Burau
+        generator of operation 'op' with undercrossing variable 'label'.
+
+        Notes
+        -----
+        The generator only differs from the identity in row abs(op) - 1,
+        so only the three columns around it change.
+
+        """
+        row = abs(op) - 1
+        if op < 0:
+            entries = {row: -label, row + 1: sp.Integer(1)}
+            if row != 0:
+                entries[row - 1] = label
+        else:
+            entries = {row: -label**-1, row + 1: label**-1}
+            if row != 0:
+                entries[row - 1] = sp.Integer(1)
+
+        col = mat[:, row]
+        for c, g in entries.items():
+            if c != row:
+                mat[:, c] = mat[:, c] + col*g
+        mat[:, row] = col*entries[row]
+
+    @staticmethod
+    def _laurent_entries(ring, op, name):
+        """
+        Protected Method
+        Row index and non-zero entries of the only non-identity row of
+        the Burau generator of operation 'op' with undercrossing
+        variable 'name'.
+        """
+        row = abs(op) - 1
+        if op < 0:
+            entries = {row: ring.gen(name, coeff = -1), row + 1: ring.one()}
+            if row != 0:
+                entries[row - 1] = ring.gen(name)
+        else:
+            entries = {row: ring.gen(name, -1, -1), row + 1: ring.gen(name, -1)}
+            if row != 0:
+                entries[row - 1] = ring.one()
+        return row, entries
+
+    @staticmethod
+    def _laurent_generator(mat, op, name):
+        """
+        Protected Method
+        Right-multiplies the Laurent_Matrix 'mat', in place, by the Burau
+        generator of operation 'op' with undercrossing variable 'name'.
+        """
+        mat.right_mul_row(*Braid_Kernel._laurent_entries(mat.ring, op, name))
+
+    def _laurent_burau(self, inplace = False):
+        """
+        Protected Method
+        Reduced Burau Matrix built with the native Laurent engine.
+        """
+        n = self.braid_group
+        ring = self._laurent_ring()
+
+        mat = Laurent_Matrix.identity(ring, n)
+        probe = self._instrument
+
+        for i, (op, label) in enumerate(zip(self.braid_word, self.undercrossing_labels)):
+            name = self._burau_label(label, symbol = False)
+
+            if inplace:
+                self._laurent_generator(mat, op, name)
+            else:
+                burau = Laurent_Matrix.identity(ring, n)
+                row = abs(op) - 1
+                if op < 0:
+                    if row != 0:
+                        burau.rows[row][row - 1] = ring.gen(name)
+                    burau.rows[row][row] = ring.gen(name, coeff = -1)
+                    burau.rows[row][row + 1] = ring.one()
+                else:
+                    if row != 0:
+                        burau.rows[row][row - 1] = ring.one()
+                    burau.rows[row][row] = ring.gen(name, -1, -1)
+                    burau.rows[row][row + 1] = ring.gen(name, -1)
+
+                mat = mat*burau
+
+            if probe is not None:
+                probe.crossing(i, op, mat)
+
+        # Delete last row and column
+        return mat.submatrix(range(n - 1), range(n - 1))
+
+    def _tree_burau(self, backend, jobs):
+        """
+        Protected Method
+        Reduced Burau Matrix as a balanced product tree of segment
+        products, computed over a process pool.
 
+        Notes
+        -----
+        The word is cut into about four segments per worker so the pool
+        stays balanced. Each segment applies its generators in place to
+        an identity matrix; adjacent products are then multiplied in
+        pairs, level by level, until one matrix remains. The tree's
+        full matrix products cost more ring operations than an in-place
+        fold, so it only pays off with enough workers.
+
+        """
+        n = self.braid_group
+        ring = self._laurent_ring() if backend == "laurent" else None
+        ops = self.braid_word
+        names = [self._burau_label(label, symbol = False) for label in self.undercrossing_labels]
+
+        size = max(1, -(-len(ops) // (4*jobs)))
+        segments = [(n, ring, ops[i:i + size], names[i:i + size]) for i in range(0, len(ops), size)]
+        if not segments:
+            segments = [(n, ring, [], [])]
+
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers = jobs) as pool:
+                mats = list(pool.map(_burau_segment, *zip(*segments)))
+                mat = _product_tree(mats, pool)
+        else:
+            mat = _product_tree([_burau_segment(*seg) for seg in segments])
+
+        # Delete last row and column
+        if ring is not None:
+            return mat.submatrix(range(n - 1), range(n - 1))
+        mat.row_del(n - 1)
+        mat.col_del(n - 1)
         return mat
-    
-    def alexander_polynomial(self, print_result = True):
+
+    def alexander_polynomial(self, print_result = True, backend = "sympy", inplace = False, method = None, jobs = None, truncate = None):
         """
         Produces the Alexander polynomial for the Braid_Kernel
 
@@ -398,6 +1012,34 @@ class Braid_Kernel(Braid):
         print_result : boolean (Default = True)
             Prints the final result of this method. Defaulted as True
             so as to be shown if mthod called individually.
+        backend : "sympy" or "laurent" (Default = "sympy")
+            Backend used to build the reduced Burau matrix, see
+            reduced_burau().
+        inplace : boolean (Default = False)
+            In-place Burau accumulation, see reduced_burau().
+        method : "sympy", "bareiss", "modular" or None (Default = None)
+            None is "sympy", or "bareiss" with truncate.
+            "sympy" takes the determinant with SymPy's Matrix.det().
+            "bareiss" builds the matrix with the Laurent engine and
+            takes a fraction-free Bareiss determinant over the
+            polynomial ring, returning the expanded polynomial.
+            "modular" builds the matrix with the Laurent engine and
+            interpolates the determinant from its values modulo
+            several primes, see modular.modular_det(). It is rarely
+            faster than "bareiss" without several jobs, and raises a
+            ValueError when the interpolation grid exceeds
+            modular.modular_det()'s max_points; use "bareiss" then.
+        jobs : int or None (Default = None)
+            Worker processes for the Burau product tree, see
+            reduced_burau(), and for the "modular" method.
+        truncate : int or None (Default = None)
+            Largest power of "x" and of "y" wanted. The exact
+            determinant is still computed in full, by "bareiss" or
+            "modular" on the Laurent engine whatever the backend and
+            inplace, and terms of higher degree in either are then
+            dropped before it is converted to SymPy; peak memory is
+            that of the full determinant, which is not cached. Cannot
+            be combined with method = "sympy".
 
         Returns
         -------
@@ -410,13 +1052,120 @@ class Braid_Kernel(Braid):
         abcd
 
         """
+        method = self._check_method(method, truncate is not None)
+
+        def build():
+            if method != "sympy":
+                ring, det = self._laurent_det(method, jobs, keep = truncate is None)
+                if truncate is not None:
+                    det = ring.truncate(det, {"x": truncate, "y": truncate})
+                return ring.to_sympy(det)
+
+            M = self._alexander_matrix(backend = backend, inplace = inplace, jobs = jobs)
+            with self._stage("determinant", method = method) as record:
+                if backend == "laurent":
+                    M = M.to_sympy()
+                record["result"] = det = M.det()
+            return det
+
+        det = self._cached(("determinant", method, truncate), build)
+
+        # Prints modified red-burau Determinant
+        if print_result:
+            print(det)
+
+        return det
+
+    def _check_method(self, method, truncate):
+        """
+        Protected Method
+        Validates a determinant method, resolving None, for
+        alexander_polynomial() and alexander_data().
+        """
+        if method is None:
+            return "bareiss" if truncate else "sympy"
+        if method not in ("sympy", "bareiss", "modular"):
+            raise ValueError("Unknown method '" + str(method) + "', use 'sympy', 'bareiss' or 'modular'.")
+        if truncate and method == "sympy":
+            raise ValueError("Truncation needs the Laurent engine, use method 'bareiss' or 'modular'.")
+        return method
+
+    def _laurent_det(self, method, jobs, keep = True):
+        """
+        Protected Method
+        Exact determinant of the modified matrix with the Laurent engine,
+        by "bareiss" or "modular", see alexander_polynomial(). Without
+        keep, the determinant is not cached, though one already cached
+        is used.
+
+        Returns
+        -------
+        ring : Laurent_Ring
+            Ring of the determinant.
+        det : dict
+            The determinant as a polynomial of the ring.
+
+        """
+        def build():
+            M = self._alexander_matrix(backend = "laurent", inplace = True, jobs = jobs)
+            with self._stage("determinant", method = method) as record:
+                if method == "modular":
+                    det = modular_det(M, jobs = jobs)
+                else:
+                    det = M.det()
+                record["result"] = det
+            return M.ring, det
+
+        key = ("determinant", "laurent", method)
+        if keep or (self._cache is not None and key in self._cache):
+            return self._cached(key, build)
+        return build()
+
+    def _alexander_matrix(self, backend = "sympy", inplace = False, jobs = None):
+        """
+        Protected Method
+        Modifies the reduced Burau matrix ready for the determinant:
+        subtracts "x" along the loop strands' diagonal and removes the
+        columns and rows of the capped strands.
 
-        M = self.reduced_burau(print_result = False)
+        Returns
+        -------
+        M : SymPy Matrix or Laurent_Matrix
+            The modified matrix, of the given backend's type.
+
+        """
+        return self._cached(("matrix", backend), lambda: self._modify_burau(backend, inplace, jobs)).copy()
+
+    def _modify_burau(self, backend, inplace, jobs):
+        """
+        Protected Method
+        Builds the modified matrix for _alexander_matrix().
+        """
+        M = self.reduced_burau(print_result = False, backend = backend, inplace = inplace, jobs = jobs)
+        with self._stage("matrix", backend = backend) as record:
+            record["result"] = M = self._delete_loops(M, backend)
+        return M
 
+    def _delete_loops(self, M, backend):
+        """
+        Protected Method
+        Subtracts "x" along the loop strands' diagonal of a reduced Burau
+        matrix and removes the capped strands' columns and rows.
+        """
         n = self.braid_group
         k = self.caps
         r = n - 2*k
 
+        if backend == "laurent":
+            # remove x
+            ring = M.ring
+            for i in range(r - 1):
+                M.rows[i][i] = ring.sub(M.rows[i][i], ring.gen("x"))
+
+            # remove columns and rows
+            rows, cols = self._alexander_indices()
+            return M.submatrix(rows, cols)
+
         # remove x
         x = sp.symbols("x")
         for i in range(r - 1):
@@ -426,14 +1175,106 @@ class Braid_Kernel(Braid):
         M = sp.Matrix([[M[:, :(r-1)], M[:, r:(n-2):2], M[:, (n-2):]]])
         # remove rows
         M = sp.Matrix([M[:r, :], M[r+1:n-1:2, :], M[n-1:, :]])
+        return M
 
-        # Prints modified red-burau Determinant
-        if print_result:
-            print(M.det())
+    def _alexander_indices(self):
+        """
+        Protected Method
+        Indices of the rows and columns of the reduced Burau matrix that
+        are kept for the Alexander polynomial's determinant.
+        """
+        n = self.braid_group
+        r = n - 2*self.caps
+        index = list(range(n - 1))
+        cols = index[:(r-1)] + index[r:(n-2):2] + index[(n-2):]
+        rows = index[:r] + index[r+1:n-1:2] + index[n-1:]
+        return rows, cols
+
+    def reduced_burau_numeric(self, points):
+        """
+        Evaluates the Reduced Burau Matrix at a batch of numeric points.
+
+        Parameters
+        ----------
+        points : array_like
+            Array of shape (P, len(self.variables(x = False))) of float
+            or complex values, one row per point, with columns ordered
+            as self.variables(x = False).
+
+        Returns
+        -------
+        mat : numpy.ndarray
+            Array of shape (P, n - 1, n - 1) holding the reduced Burau
+            matrix at each point.
+
+        Notes
+        -----
+        No SymPy objects are built: each generator is applied to the
+        whole batch at once as an in-place column update.
+
+        """
+        n = self.braid_group
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != len(self.variables(x = False)):
+            raise ValueError("Points must have shape (P, " + str(len(self.variables(x = False))) + ").")
+        dtype = np.result_type(points.dtype, np.float64)
+        column = {name: i for i, name in enumerate(self.variables(x = False))}
+
+        mat = np.zeros((len(points), n, n), dtype = dtype)
+        mat[:, range(n), range(n)] = 1
+        for op, label in zip(self.braid_word, self.undercrossing_labels):
+            v = points[:, column[self._burau_label(label, symbol = False)]].astype(dtype)
+            row = abs(op) - 1
+            if op < 0:
+                entries = {row: -v, row + 1: 1}
+                if row != 0:
+                    entries[row - 1] = v
+            else:
+                entries = {row: -1 / v, row + 1: 1 / v}
+                if row != 0:
+                    entries[row - 1] = 1
+            col = mat[:, :, row].copy()
+            for c, g in entries.items():
+                if c != row:
+                    mat[:, :, c] += col * np.reshape(g, (-1, 1))
+            mat[:, :, row] = col * entries[row][:, None]
+
+        # Delete last row and column
+        return mat[:, :n - 1, :n - 1]
+
+    def alexander_polynomial_numeric(self, points):
+        """
+        Evaluates the Alexander polynomial at a batch of numeric points.
+
+        Parameters
+        ----------
+        points : array_like
+            Array of shape (P, len(self.variables())) of float or
+            complex values, one row per point, with columns ordered as
+            self.variables() ("x" first).
+
+        Returns
+        -------
+        det : numpy.ndarray
+            Array of shape (P,) holding the determinant at each point.
 
-        return M.det()
-    
-    def alexander_data(self, print_result = True):
+        """
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != len(self.variables()):
+            raise ValueError("Points must have shape (P, " + str(len(self.variables())) + ").")
+        M = self.reduced_burau_numeric(points[:, 1:])
+
+        r = self.braid_group - 2*self.caps
+        # remove x
+        idx = np.arange(r - 1)
+        M[:, idx, idx] -= points[:, :1]
+
+        # remove columns and rows
+        rows, cols = self._alexander_indices()
+        M = M[:, rows][:, :, cols]
+        return np.linalg.det(M)
+
+    def alexander_data(self, print_result = True, backend = "sympy", inplace = False, method = None, jobs = None, truncate = False):
         """
         Produces the Alexander Data of the Braid_Kernel.
 
@@ -442,37 +1283,79 @@ class Braid_Kernel(Braid):
         print_result : boolean (Default = True)
             Prints the final result of this method. Defaulted as True
             so as to be shown if mthod called individually.
-        
+        backend : "sympy" or "laurent" (Default = "sympy")
+            Backend used to build the reduced Burau matrix, see
+            reduced_burau().
+        inplace : boolean (Default = False)
+            In-place Burau accumulation, see reduced_burau().
+        method : "sympy", "bareiss", "modular" or None (Default = None)
+            Determinant method, see alexander_polynomial().
+        jobs : int or None (Default = None)
+            Worker processes, see alexander_polynomial().
+        truncate : boolean (Default = False)
+            Reads the grid straight from the Laurent engine's exact
+            determinant, by "bareiss" or "modular", in one pass that
+            keeps only the terms of degree 1 to (r + k - 1) in "x" and
+            in "y". The determinant is still computed in full, so peak
+            memory is unchanged, but it is never converted to SymPy,
+            which is most of the cost of a large one, and is not
+            cached. Cannot be combined with method = "sympy".
+
         Returns
         -------
+        U : SymPy Expression
+            "y" times the linking numbers of the strands with the loops.
+        V : SymPy Expression
+            "x" times the linking numbers of the strands with "y".
+        data : SymPy Matrix
+            Coefficient grid of the determinant in U and V: entry [j, i]
+            is the coefficient of U**(j + 1)*V**(i + 1).
 
         Notes
         -----
+        Every stage is cached on the Kernel, see clear_cache().
 
         """
-        # Gets Alexander Poly. / determinant
-        det = self.alexander_polynomial(print_result = False)
-        det = sp.simplify(det)
-
-        x = sp.symbols("x")
-        y = sp.symbols("y")
-
         n = self.braid_group
         k = self.caps
         r = n - 2*k
+        size = r + k - 1
+        method = self._check_method(method, truncate)
+        key = (method, size if truncate else None)
+
+        U, V = self._cached(("linking",), lambda: self._measured("linking", self._linking_monomials))
+        if print_result:
+            print("U = ", U)
+            print("V = ", V)
+
+        # Gets Alexander Poly. / determinant with t subbed for s^2
+        gens, terms = self._cached(("substitution",) + key,
+                                   lambda: self._substituted_terms(backend, inplace, method, jobs, truncate))
+
+        # PRINTS ALEX POLY with subbed si
+        if print_result:
+            sp.pprint(self._cached(("substitution", "sympy") + key, lambda: self._terms_to_sympy(gens, terms)))
+
+        data = self._cached(("coefficients",) + key,
+                            lambda: self._measured("coefficients", lambda: self._data_grid(gens, terms, U, V, size)))
+        return U, V, data.copy()
+
+    def _linking_monomials(self):
+        """
+        Protected Method
+        U and V of the Alexander Data, built from the linking numbers of
+        the strands with the loops and with the "y" strand.
+        """
+        r = self.braid_group - 2*self.caps
+
+        x = sp.symbols("x")
+        y = sp.symbols("y")
 
         U = y
         V = x
 
         # Finding linking no.s and constructing U and V
-        # finds strands that cross the y strand
-        strands = []
-        prev = 0
-        for index, op in enumerate(self.braid_word):
-            if op == -1 and prev == -1:
-                # grab strand from undercrossing labels
-                strands.append(self.undercrossing_labels[index])
-            prev = op
+        strands = self._y_crossings()
 
         for i, g in enumerate(self.eq):
             # skip y strand
@@ -492,41 +1375,166 @@ class Braid_Kernel(Braid):
             U *= s**a
             V *= s**b
 
-        print("U = ", U)
-        print("V = ", V)
-
-        # Subbing t for s^2.
-        for i in det.free_symbols:
-            if i != x and i != y:
-                t = sp.symbols(str(i))
-                s = sp.symbols("s" + str(i)[-1])
-                det = det.subs(t, s**2)
-        
-        # PRINTS ALEX POLY with subbed si
-        sp.pprint(det)
-        # This works at leat for this specific det but the method is GREEDY.
-        # sp.pprint(sp.collect(det, [x**2*y**2, x**2*y, x*y**2, x*y, x, y]))
-
-        # max power is (r + k - 1)
-        data = sp.zeros(r + k - 1)
-        for i in range(r + k - 1):
-            for j in range(r + k - 1):
-                # print("\nRow:", (j + 1), "Col: ", (i + 1))
-                UV = U**(j + 1)*V**(i + 1)
-                # sp.pprint(UV)
-                term = det.coeff(x**(i + 1)*y**(j + 1))
-                # sp.pprint(term)
-                if term != 0:
-                    inpt = 0
-                    for t in sp.Add.make_args(term):
-                        inpt += t / UV
-                        # sp.pprint(inpt.simplify())
-                data[j, i] = inpt
-
-        # sp.pprint(data.applyfunc(sp.simplify))
-                
         return U, V
 
+    def _y_crossings(self):
+        """
+        Protected Method
+        Labels of the strands that cross the "y" strand, kept from
+        before the word was reduced, if it was.
+        """
+        if self._y_strands is not None:
+            return self._y_strands
+
+        # finds strands that cross the y strand
+        strands = []
+        prev = 0
+        labels = self.undercrossing_labels
+        for index, op in enumerate(self.braid_word):
+            if op == -1 and prev == -1:
+                # grab strand from undercrossing labels
+                strands.append(labels[index])
+            prev = op
+        return strands
+
+    def _substituted_terms(self, backend, inplace, method, jobs, truncate):
+        """
+        Protected Method
+        Terms of the Alexander polynomial with every strand variable
+        replaced by the square of its class's "s?", see alexander_data().
+
+        Returns
+        -------
+        gens : list
+            SymPy symbols "x", "y", then "s?" for each strand class
+            other than that of "y", "s?" numbered as in U and V.
+        terms : dict
+            Maps each tuple of exponents of gens to its coefficient.
+
+        Notes
+        -----
+        The substitution is a single pass over the expanded polynomial's
+        terms that doubles the strand exponents; no expression tree is
+        rewritten and nothing is simplified.
+
+        """
+        if truncate:
+            ring, det = self._laurent_det(method, jobs, keep = False)
+            with self._stage("substitution") as record:
+                gens, terms = self._substitute_laurent(ring, det, self.braid_group - self.caps - 1)
+                record["result"] = terms
+            return gens, terms
+
+        det = self.alexander_polynomial(print_result = False, backend = backend, inplace = inplace, method = method,
+                                        jobs = jobs)
+
+        with self._stage("substitution") as record:
+            gens, terms = self._substitute(det)
+            record["result"] = terms
+        return gens, terms
+
+    def _substitution_gens(self):
+        """
+        Protected Method
+        Generators of the substituted polynomial, see
+        _substituted_terms(), and the (position, scale) in them of each
+        variable name of the Alexander polynomial.
+        """
+        # t of the class at index i becomes s(i + 1)**2
+        gens = list(sp.symbols("x y"))
+        index = {"x": (0, 1), "y": (1, 1)}
+        for i, g in enumerate(self.eq):
+            if g[0][0] != 1:
+                index[self._burau_label(g[0][0], symbol = False)] = (len(gens), 2)
+                gens.append(sp.symbols("s" + str(i + 1)))
+        return gens, index
+
+    def _substitute(self, det):
+        """
+        Protected Method
+        Reads the terms of a polynomial, doubling strand exponents, for
+        _substituted_terms().
+        """
+        gens, index = self._substitution_gens()
+
+        def collect(expr):
+            terms = {}
+            for term in sp.Add.make_args(expr):
+                coeff, monomial = term.as_coeff_Mul()
+                exps = [0] * len(gens)
+                for base, e in monomial.as_powers_dict().items():
+                    if base == 1:
+                        continue
+                    if not base.is_Symbol or base.name not in index or not e.is_Integer:
+                        return None
+                    v, scale = index[base.name]
+                    exps[v] += int(e) * scale
+                exps = tuple(exps)
+                terms[exps] = terms.get(exps, 0) + coeff
+            return {e: c for e, c in terms.items() if c != 0}
+
+        terms = collect(sp.expand(det))
+        if terms is None:
+            # Determinants left as a quotient are put over a monomial first
+            terms = collect(sp.expand(sp.cancel(det)))
+        return gens, terms
+
+    def _substitute_laurent(self, ring, det, size):
+        """
+        Protected Method
+        Reads the terms of a Laurent engine determinant of degree 1 to
+        size in "x" and in "y", doubling strand exponents, for
+        _substituted_terms(). Every other term is skipped in the same
+        pass, without converting the determinant to SymPy.
+        """
+        gens, index = self._substitution_gens()
+        places = [index[v] for v in ring.variables]
+        terms = {}
+        for key, c in ring.truncate(det, {"x": size, "y": size}).items():
+            exps = [0] * len(gens)
+            for (v, scale), e in zip(places, ring.unpack(key)):
+                exps[v] += e * scale
+            if exps[0] >= 1 and exps[1] >= 1:
+                terms[tuple(exps)] = sp.Integer(c)
+        return gens, terms
+
+    @staticmethod
+    def _terms_to_sympy(gens, terms):
+        """
+        Protected Function
+        SymPy expression of a dict of terms over gens.
+        """
+        return sp.Add(*[c * sp.Mul(*[g**e for g, e in zip(gens, exps)]) for exps, c in terms.items()])
+
+    @staticmethod
+    def _data_grid(gens, terms, U, V, size):
+        """
+        Protected Function
+        Coefficient grid of the substituted determinant in U and V, see
+        alexander_data().
+        """
+        # Strand exponents of U and V
+        u = U.as_powers_dict()
+        v = V.as_powers_dict()
+        a = [int(u.get(g, 0)) for g in gens[2:]]
+        b = [int(v.get(g, 0)) for g in gens[2:]]
+
+        # max power is (r + k - 1), coefficients collected in one pass
+        # over the terms, dividing out the strand part of
+        # U**(j + 1)*V**(i + 1).
+        coeffs = {}
+        for exps, c in terms.items():
+            i, j = exps[0], exps[1]
+            if 1 <= i <= size and 1 <= j <= size:
+                rest = [e - j*p - i*q for e, p, q in zip(exps[2:], a, b)]
+                coeffs.setdefault((j - 1, i - 1), []).append(c * sp.Mul(*[g**e for g, e in zip(gens[2:], rest)]))
+
+        data = sp.zeros(size)
+        for (j, i), cell in coeffs.items():
+            data[j, i] = sp.Add(*cell)
+
+        return data
+
     def draw(self, style = "ext", linewidth = 3, gap_size = 5, color = "rainbow", save = False):
         """
         Draws the Braid_Kernel as a MatpLotlib figure. 
@@ -552,67 +1560,38 @@ class Braid_Kernel(Braid):
                 'y': yellow,
                 'k': black,
                 'w': white}
+        save : boolean or str (Default = False)
+            Saves the figure, to "test.svg" if True or to the given
+            path, with render() instead of showing it.
 
         Notes
         -----
         abcd
         
+        """
+        super().draw(style, linewidth, gap_size, color, save)
+
+    def render(self, target = None, format = None, style = "ext", linewidth = 3, gap_size = 5, color = "rainbow",
+               dpi = 100, figsize = None):
+        """
+        Renders the Braid_Kernel without a display, see Braid.render().
+        """
+        return super().render(target, format, style, linewidth, gap_size, color, dpi, figsize)
+
+    def _plot(self, fig, style, linewidth, gap_size, color):
+        """
+        Protected Method
+        Draws the Braid_Kernel, with its loops and caps, onto a
+        MatPlotLib figure.
         """
         n = self.braid_group
-        braid = self.braid_word
         caps = self.caps
 
         # Est. figure
-        fig, ax = plt.subplots(figsize = (6, 8))
-
-        # Initial Values
-        t = np.arange(0, 1.05, 0.05)
-        x = 0
-        layer = []
-
-        # line break
-        lb = np.array([[np.NaN, np.NaN]])
-
-        # Strands
-        strands = [np.empty((0, 2)) for _ in range(n)]
-
-        # Start positons
-        for s in range(1, n + 1):
-            S = np.array([[s], [0]]).T
-            strands[s - 1] = np.concatenate((strands[s - 1], S))
-
-        # Calc crossing points
-        for count, op in enumerate(braid):
-            i = abs(op)
-
-            if style == "comp":
-                if i in layer or i + 1 in layer:
-                    layer = []
-                    x += 2
-                layer.append(i)
-                layer.append(i + 1)
-
-            # Crossing Matrices
-            R1 = np.array([0.5*t**2 + i, -t - x]).T
-            R2 = np.array([-0.5*t**2 + 1 + i, t - 2 - x]).T
-            L1 = np.array([-0.5*t**2 + 1 + i, -t - x]).T
-            L2 = np.array([0.5*t**2 + i, t - 2 - x]).T
-
-            if np.sign(op) == 1:    # overcrossing
-                strands[i - 1] = np.concatenate((strands[i - 1], R1, np.flipud(R2)))
-                strands[i] = np.concatenate((strands[i], L1[:-gap_size, :], lb, np.flipud(L2[:-gap_size, :])))
-            elif np.sign(op) == -1:     # undercrossing
-                strands[i - 1] = np.concatenate((strands[i - 1], R1[:-gap_size, :], lb, np.flipud(R2[:-gap_size, :])))
-                strands[i] = np.concatenate((strands[i], L1, np.flipud(L2)))
-
-            # swap lines for each operation
-            strands[i - 1], strands[i] = strands[i], strands[i - 1]
-
-            if style == "ext" or count + 1 == len(braid):
-                x += 2
-
-        # Enpoints, Loopping + caps
-        for k in range(1, n + 1):
+        ax = fig.subplots()
+
+        # Endpoints, Looping + caps
+        def tails(k, x):
             # Loops
             if k <= n - 2*caps:
                 # Initial values..
@@ -626,10 +1605,9 @@ class Braid_Kernel(Braid):
                 o_x = np.concatenate([-loop_x[::-1], loop_x])
                 o_y = np.concatenate([loop_y[::-1], loop_y])
                 T = np.array([o_x, o_y]).T
-                # Add to strand matrixes
-                strands[k - 1] = np.concatenate([strands[k - 1], B, T])
+                return np.concatenate([B, T])
             # Caps
-            elif (k % 2) == (n % 2):
+            if (k % 2) == (n % 2):
                 # Initial values..
                 loop_x = np.arange(0, 0.55, 0.05)
                 loop_y = np.sqrt(0.5**2 - loop_x**2)
@@ -641,35 +1619,85 @@ class Braid_Kernel(Braid):
                 o_x = np.concatenate([-loop_x[::-1], loop_x])
                 o_y = np.concatenate([loop_y[::-1], loop_y])
                 T = np.array([o_x + k - 0.5, o_y]).T
-                # Add to strand matrixes
-                strands[k - 1] = np.concatenate([strands[k - 1], B, lb, T])
+                return np.concatenate([B, [[np.nan, np.nan]], T])
             # Endpoints
-            else:
-                S = np.array([[k], [-x]]).T
-                strands[k - 1] = np.concatenate((strands[k - 1], S))
+            return np.array([[k, -x]], dtype = float)
 
-        # PLOTTING (plot sam,e colours in final version using available equivalence infomation!!!!!)
+        paths, x = braid_geometry(n, self._word, style, gap_size, tails)
+
+        # Strands coloured by equivalence class
         if color == "rainbow":
+            colors = [None] * n
             for group in range(len(self.eq)):
                 for s in self.eq[group]:
-                    ax.plot(strands[s[0] - 1][:, 0], strands[s[0] - 1][:, 1], lw = linewidth, c = "C" + str(group))
+                    colors[s[0] - 1] = "C" + str(group)
         else:
-            for s in range(n):
-                ax.plot(strands[s][:, 0], strands[s][:, 1], lw = linewidth, c = color)
+            colors = [color] * n
+        ax.add_collection(strand_collection(paths, colors, linewidth))
+        ax.autoscale_view()
 
         # Figure Details
-        fig.suptitle("Braid:   " + str(braid) + "\nNumber of Caps:   " + str(caps))
+        frame_figure(fig, "Braid:   " + word_title(self._word) + "\nNumber of Caps:   " + str(caps))
         ax.axis("off")
-        ax.set_aspect(2*n / x)
-        plt.tight_layout()
-    
-        # SAVE CHECK
-        if save:
-            plt.savefig("test.svg")
+        ax.set_aspect(2*n / max(x, 1))
+
+
+def _burau_segment(n, ring, ops, names):
+    """
+    Protected Function
+    Product of the Burau generators of one segment of a braid word,
+    applied in place to the identity matrix.
+
+    Parameters
+    ----------
+    n : int
+        Number of strands.
+    ring : Laurent_Ring or None
+        Ring of the Laurent backend, or None for the SymPy backend.
+    ops : list
+        The segment's Artin operations.
+    names : list
+        Undercrossing variable name of each operation.
+
+    """
+    if ring is None:
+        mat = sp.eye(n)
+        for op, name in zip(ops, names):
+            Braid_Kernel._sympy_generator(mat, op, sp.symbols(name))
+    else:
+        mat = Laurent_Matrix.identity(ring, n)
+        for op, name in zip(ops, names):
+            Braid_Kernel._laurent_generator(mat, op, name)
+    return mat
+
+
+def _multiply(a, b):
+    """
+    Protected Function
+    Matrix product a*b, as a picklable function for process pools.
+    """
+    return a*b
+
+
+def _product_tree(mats, pool = None):
+    """
+    Protected Function
+    Ordered product of a list of matrices, multiplying neighbours in
+    pairs level by level, optionally over a process pool.
+    """
+    while len(mats) > 1:
+        left, right = mats[0::2], mats[1::2]
+        if pool is not None:
+            products = list(pool.map(_multiply, left, right))
         else:
-            plt.show()
+            products = [a*b for a, b in zip(left, right)]
+        if len(mats) % 2:
+            products.append(mats[-1])
+        mats = products
+    return mats[0]
 
 
+# Example, run with python -m alexdata.alexdata
 if __name__ == "__main__":
 
     # new = Braid(5, 3, 2, 2, -4, -1, -1, -2, -3, -4)   
@@ -0,0 +1,312 @@
+"""
+Batch Computation
+=================
+Runs the Braid_Kernel pipeline (strand labels, reduced Burau,
+Alexander polynomial, Alexander Data) over a stream of kernel specs in
+a pool of worker processes.
+
+thumbnails() renders an image of every kernel the same way, for
+previews.
+
+Specs are read lazily, from any iterable or from a JSONL file, and
+only a bounded window of chunks is in flight at any time, so memory
+does not grow with the size of the catalogue. Results are streamed
+back either in input order or as they complete.
+
+A spec is either a mapping {"n": 5, "k": 1, "ops": [3, 2, ...]} or a
+sequence (n, k, ops).
+
+"""
+
+# Dependent Libraries
+import json
+import os
+import signal
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .alexdata import Braid_Kernel
+from .cache import Result_Cache
+from .serialise import encode_result
+
+
+__all__ = [
+    "STAGES",
+    "compute",
+    "parse_spec",
+    "read_specs",
+    "thumbnails"
+]
+
+
+# Pipeline stages that can be requested
+STAGES = ("labels", "burau", "polynomial", "data")
+
+# Stage that renders the kernel instead
+_RENDER = "render"
+
+
+class _Timeout(Exception):
+    """
+    Raised inside a worker when a kernel exceeds its time budget.
+    """
+
+
+def read_specs(source):
+    """
+    Lazily yields (n, k, ops) specs from an iterable or a JSONL file.
+
+    Parameters
+    ----------
+    source : iterable or str or os.PathLike
+        Iterable of specs, or the path of a JSONL file with one spec
+        per (non-blank) line.
+
+    Yields
+    ------
+    spec : tuple
+        (n, k, ops) with ops a tuple of ints.
+
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as f:
+            for line in f:
+                if line.strip():
+                    yield parse_spec(json.loads(line))
+    else:
+        for spec in source:
+            yield parse_spec(spec)
+
+
+def parse_spec(spec):
+    """
+    Normalises a single spec, a mapping or a sequence, into (n, k, ops).
+    """
+    if isinstance(spec, dict):
+        n, k, ops = spec["n"], spec["k"], spec["ops"]
+    else:
+        n, k, ops = spec
+    return int(n), int(k), tuple(int(op) for op in ops)
+
+
+def _run_stage(spec, stage, options):
+    """
+    Protected Function
+    Builds the kernel for a spec and runs the requested stage.
+    """
+    n, k, ops = spec
+    kernel = Braid_Kernel(n, k, *ops)
+    if stage == "labels":
+        return {"undercrossing_labels": kernel.undercrossing_labels, "eq": kernel.eq}
+    if stage == "burau":
+        return kernel.reduced_burau(print_result = False, **options)
+    if stage == "polynomial":
+        return kernel.alexander_polynomial(print_result = False, **options)
+    if stage == _RENDER:
+        return kernel.render(**options)
+    U, V, data = kernel.alexander_data(print_result = False, **options)
+    return {"U": U, "V": V, "data": data}
+
+
+def _on_alarm(signum, frame):
+    raise _Timeout()
+
+
+def _run_chunk(chunk, stage, timeout, options, cache = None, compact = False):
+    """
+    Protected Function
+    Runs a chunk of (index, spec) pairs, each under its own time budget.
+
+    Notes
+    -----
+    The budget is enforced with a real-time interval timer, which can
+    only be armed from a process's main thread; elsewhere it is not
+    enforced. Pool workers run their tasks on their main thread.
+
+    """
+    timed = timeout is not None and threading.current_thread() is threading.main_thread()
+    if timed:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+
+    results = []
+    try:
+        for index, spec in chunk:
+            record = {"index": index, "spec": spec, "status": "ok", "result": None, "error": None}
+            try:
+                if timed:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                try:
+                    if cache is None:
+                        record["result"] = _run_stage(spec, stage, options)
+                    else:
+                        record["result"] = cache.fetch(spec, stage, options, lambda: _run_stage(spec, stage, options))
+                    if compact:
+                        record["result"] = encode_result(stage, record["result"])
+                finally:
+                    if timed:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except _Timeout:
+                record["status"] = "timeout"
+                record["error"] = "Exceeded time budget of " + str(timeout) + "s."
+            except Exception as e:
+                record["status"] = "error"
+                record["error"] = type(e).__name__ + ": " + str(e)
+            results.append(record)
+    finally:
+        if timed:
+            signal.signal(signal.SIGALRM, previous)
+    return results
+
+
+def _chunks(specs, chunksize):
+    """
+    Protected Function
+    Groups an iterable of specs into lists of (index, spec) pairs.
+    """
+    chunk = []
+    for index, spec in enumerate(specs):
+        chunk.append((index, spec))
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def compute(specs, jobs = None, chunksize = 1, ordered = True, timeout = None, stage = "data", cache = None, compact = False,
+            **options):
+    """
+    Streams the Braid_Kernel pipeline over many kernel specs.
+
+    Parameters
+    ----------
+    specs : iterable or str or os.PathLike
+        Kernel specs, or a JSONL file of them, see read_specs().
+    jobs : int or None (Default = None)
+        Number of worker processes. None, or 1, runs every kernel in
+        this process.
+    chunksize : int (Default = 1)
+        Number of kernels sent to a worker at once.
+    ordered : boolean (Default = True)
+        Yields results in input order if True, otherwise as soon as
+        each chunk completes.
+    timeout : float or None (Default = None)
+        Time budget, in seconds, for each kernel.
+    stage : "labels", "burau", "polynomial" or "data" (Default = "data")
+        Last pipeline stage to run. "render" instead returns an image
+        of the kernel, see Braid_Kernel.render().
+    cache : Result_Cache or str or os.PathLike or None (Default = None)
+        Persistent result cache, or the path of one, shared by every
+        worker. Kernels found in it are not recomputed.
+    compact : boolean (Default = False)
+        Returns each result in its array form, see
+        serialise.encode_result(): plain NumPy arrays, which need no
+        SymPy to unpickle and can be stacked into one result set with
+        serialise.stack(). For small results this is larger than the
+        pickled SymPy objects. Not for "render".
+    **options
+        Passed on to the stage's Braid_Kernel method, e.g.
+        method = "bareiss" or truncate = True.
+
+    Yields
+    ------
+    record : dict
+        {"index", "spec", "status", "result", "error"} for each kernel,
+        where status is "ok", "timeout" or "error".
+
+    Notes
+    -----
+    At most two chunks per worker are in flight at any time, so specs
+    are only read as fast as they are processed.
+
+    """
+    if stage not in STAGES and stage != _RENDER:
+        raise ValueError("Unknown stage '" + str(stage) + "', use one of " + str(STAGES) + ".")
+    if chunksize < 1:
+        raise ValueError("Chunk size must be positive.")
+    if compact and stage == _RENDER:
+        raise ValueError("Rendered images have no compact form.")
+    if cache is not None and not isinstance(cache, Result_Cache):
+        cache = Result_Cache(cache)
+    chunks = _chunks(read_specs(specs), chunksize)
+
+    if jobs is None or jobs <= 1:
+        for chunk in chunks:
+            yield from _run_chunk(chunk, stage, timeout, options, cache, compact)
+        return
+
+    window = 2 * jobs
+    with ProcessPoolExecutor(max_workers = jobs) as pool:
+        def submit(chunk):
+            return pool.submit(_run_chunk, chunk, stage, timeout, options, cache, compact)
+
+        if ordered:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(submit(chunk))
+                if len(pending) >= window:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            for chunk in chunks:
+                pending.add(submit(chunk))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when = FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when = FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def thumbnails(specs, directory, format = "png", jobs = None, chunksize = 8, timeout = None, names = None,
+               dpi = 40, figsize = (3, 4), **options):
+    """
+    Renders preview images of many kernels into a directory.
+
+    Parameters
+    ----------
+    specs : iterable or str or os.PathLike
+        Kernel specs, or a JSONL file of them, see read_specs().
+    directory : str or os.PathLike
+        Directory the images are written to, created if missing.
+    format : str (Default = "png")
+        Image format.
+    jobs, chunksize, timeout
+        See compute().
+    names : callable or None (Default = None)
+        names(index, spec) gives the file name, without suffix, of each
+        image. By default images are named by their index.
+    dpi : int (Default = 40)
+        Resolution of the images.
+    figsize : tuple (Default = (3, 4))
+        Size of the images in inches.
+    **options
+        Passed on to Braid_Kernel.render(), e.g. style = "comp".
+
+    Yields
+    ------
+    record : dict
+        As compute(), with the path of the written image as result.
+
+    Notes
+    -----
+    Images are rendered in the workers, headless, and written by this
+    process as they complete.
+
+    """
+    os.makedirs(directory, exist_ok = True)
+    records = compute(specs, jobs = jobs, chunksize = chunksize, ordered = False, timeout = timeout, stage = _RENDER,
+                      format = format, dpi = dpi, figsize = figsize, **options)
+    for record in records:
+        if record["status"] == "ok":
+            name = str(record["index"]) if names is None else names(record["index"], record["spec"])
+            path = os.path.join(directory, name + "." + format)
+            with open(path, "wb") as f:
+                f.write(record["result"])
+            record["result"] = path
+        yield record
@@ -0,0 +1,237 @@
+"""
+Result Cache
+============
+Persistent, process-safe cache of Braid_Kernel pipeline results.
+
+Results are stored in a SQLite database in write-ahead-log mode, so
+any number of worker processes can read and write it concurrently, and
+survive process restarts. Each entry is keyed by a digest of the
+canonical encoding of the kernel (braid group, caps and braid word),
+the pipeline stage and the options that change its result, and by the
+result format version, so that results cached by an older version of
+the library are never served. The number of entries is bounded, least
+recently used entries being evicted first.
+
+"""
+
+# Dependent Libraries
+import hashlib
+import os
+import pickle
+import sqlite3
+import struct
+import time
+
+import numpy as np
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "Result_Cache"
+]
+
+
+# Options that change how a result is computed, but not the result
+_IGNORED_OPTIONS = ("jobs", "inplace")
+
+# Version of the pipeline's results, part of every key. Bump it whenever
+# a stage's result changes, so that stale entries are never served.
+FORMAT_VERSION = 2
+
+# Last-used times of cache hits are written in batches of this size
+_TOUCH_BATCH = 256
+
+
+class Result_Cache():
+    """
+    On-disk LRU cache of Braid_Kernel pipeline results.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of the SQLite database, created if missing.
+    max_entries : int (Default = 100000)
+        Largest number of results kept.
+    timeout : float (Default = 30)
+        Seconds to wait for another process's write lock.
+
+    Notes
+    -----
+    Connections are opened lazily, one per process, so a Result_Cache
+    can be handed to pool workers, which reopen the database by path.
+    Reading an entry refreshes its last-used time; so that reads take no
+    write lock, refreshes are buffered and written in batches, on the
+    next put() and on close().
+
+    """
+    def __init__(self, path, max_entries = 100000, timeout = 30):
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry.")
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._conn = None
+        self._pid = None
+        self._touched = {}
+
+    def __getstate__(self):
+        return {"path": self.path, "max_entries": self.max_entries, "timeout": self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _connect(self):
+        """
+        Protected Method
+        Returns this process's connection, opening it on first use.
+        """
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout = self.timeout, isolation_level = None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS results "
+                         "(key BLOB PRIMARY KEY, value BLOB NOT NULL, used REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self._conn = conn
+            self._pid = os.getpid()
+            self._touched = {}
+        return self._conn
+
+    def _flush(self):
+        """
+        Protected Method
+        Writes the buffered last-used times of cache hits.
+        """
+        if self._touched:
+            touched = [(used, key) for key, used in self._touched.items()]
+            self._touched = {}
+            conn = self._connect()
+            if conn.in_transaction:
+                conn.executemany("UPDATE results SET used = ? WHERE key = ?", touched)
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("UPDATE results SET used = ? WHERE key = ?", touched)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """
+        Closes this process's connection, if open.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            self._flush()
+            self._conn.close()
+        self._conn = None
+        self._touched = {}
+
+    @staticmethod
+    def key(n, k, ops, stage = "data", **options):
+        """
+        Digest of the canonical encoding of a kernel and stage, under
+        the current FORMAT_VERSION.
+
+        Parameters
+        ----------
+        n : int
+            Braid group.
+        k : int
+            Number of caps.
+        ops : sequence of int
+            Braid word.
+        stage : str (Default = "data")
+            Pipeline stage, see batch.STAGES.
+        **options
+            Stage options; those that do not change the result, such
+            as jobs, are ignored.
+
+        Returns
+        -------
+        key : bytes
+            16 byte digest.
+
+        """
+        word = np.asarray(ops, dtype = "<i4").tobytes()
+        extra = sorted((name, repr(value)) for name, value in options.items() if name not in _IGNORED_OPTIONS)
+        h = hashlib.blake2b(digest_size = 16)
+        h.update(struct.pack("<iiI", n, k, len(ops)))
+        h.update(word)
+        h.update(repr((FORMAT_VERSION, stage, extra)).encode())
+        return h.digest()
+
+    def get(self, key, default = None):
+        """
+        Returns the result stored under key, or default.
+        """
+        conn = self._connect()
+        row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        self._touched[key] = time.time()
+        if len(self._touched) >= _TOUCH_BATCH:
+            self._flush()
+        return pickle.loads(row[0])
+
+    def put(self, key, value):
+        """
+        Stores a result under key, evicting the least recently used
+        entries beyond max_entries.
+        """
+        conn = self._connect()
+        blob = pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._flush()
+            conn.execute("INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, ?)", (key, blob, time.time()))
+            excess = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute("DELETE FROM results WHERE key IN "
+                             "(SELECT key FROM results ORDER BY used LIMIT ?)", (excess,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def fetch(self, spec, stage, options, build):
+        """
+        Returns the cached result for a kernel spec and stage, computing
+        it with build() and storing it on a miss.
+
+        Parameters
+        ----------
+        spec : tuple
+            (n, k, ops) kernel spec.
+        stage : str
+            Pipeline stage.
+        options : dict
+            Stage options.
+        build : callable
+            Computes the result on a miss.
+
+        """
+        n, k, ops = spec
+        key = self.key(n, k, ops, stage, **options)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        self._touched = {}
+        self._connect().execute("DELETE FROM results")
@@ -0,0 +1,275 @@
+"""
+Kernel Enumeration
+==================
+Enumerates the braid words of Braid_Kernel(n, k, *ops) up to a given
+length, and screens each kernel as it is generated, sharded over a pool
+of worker processes.
+
+Words are generated depth first in a fixed letter order (1, -1, 2, -2,
+...). Freely reducible words, those with an operation next to its
+inverse, are never generated: they are the same braid as a shorter
+word. Optionally only one word of each orbit under cyclic rotation,
+reversal and mirroring (inverting every crossing) is kept, the least
+in letter order, and prefixes that cannot start such a word are pruned
+whole.
+
+The space is sharded by word prefix: every canonical prefix of a given
+depth is one task, run in a worker that walks the words below it,
+builds each kernel (tracking its strands) and keeps those passing the
+screen. Only the kernels that pass come back from the workers.
+
+"""
+
+# Dependent Libraries
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .alexdata import Braid_Kernel, _word_dtype
+
+
+__all__ = [
+    "SYMMETRIES",
+    "Numeric_Screen",
+    "search",
+    "words"
+]
+
+
+# Word symmetries that can be pruned
+SYMMETRIES = ("rotation", "reversal", "mirror")
+
+# Evaluation points of the numeric screen, "x" then every other variable
+_POINTS = ((0.6 + 0.8j, -0.28 + 0.96j), (0.8 - 0.6j, 0.96 + 0.28j), (-0.6 + 0.8j, 0.28 - 0.96j))
+
+
+def _check_symmetries(symmetries):
+    """
+    Protected Function
+    Validates a collection of symmetries.
+    """
+    symmetries = tuple(symmetries)
+    for s in symmetries:
+        if s not in SYMMETRIES:
+            raise ValueError("Unknown symmetry '" + str(s) + "', use any of " + str(SYMMETRIES) + ".")
+    return symmetries
+
+
+def _rank(op):
+    """
+    Protected Function
+    Position of an operation in the letter order 1, -1, 2, -2, ...
+    """
+    return 2*abs(op) - (op > 0)
+
+
+def _orbit(ops, symmetries):
+    """
+    Protected Function
+    Every word equivalent to ops under the given symmetries.
+    """
+    orbit = [ops]
+    if "mirror" in symmetries:
+        orbit += [tuple(-op for op in w) for w in orbit]
+    if "reversal" in symmetries:
+        orbit += [w[::-1] for w in orbit]
+    if "rotation" in symmetries:
+        orbit = [w[i:] + w[:i] for w in orbit for i in range(len(w))]
+    return orbit
+
+
+def _canonical(ops, symmetries):
+    """
+    Protected Function
+    Whether ops is the least word of its orbit, and, under rotation,
+    not cyclically reducible.
+    """
+    if "rotation" in symmetries and len(ops) > 1 and ops[0] == -ops[-1]:
+        return False
+    key = [_rank(op) for op in ops]
+    return all(key <= [_rank(op) for op in w] for w in _orbit(ops, symmetries))
+
+
+def _letters(n, prefix, symmetries):
+    """
+    Protected Function
+    Operations that can follow a prefix without making the word freely
+    reducible, or every canonical word below it non-canonical.
+    """
+    letters = sorted((op for i in range(1, n) for op in (i, -i)), key = _rank)
+    if not prefix:
+        # The least word of a mirror orbit starts with a positive crossing
+        return [op for op in letters if op > 0] if "mirror" in symmetries else letters
+    letters = [op for op in letters if op != -prefix[-1]]
+    if "rotation" in symmetries:
+        # The least rotation starts with the least letter
+        first = _rank(prefix[0])
+        letters = [op for op in letters if _rank(op) >= first]
+        if "mirror" in symmetries:
+            letters = [op for op in letters if _rank(-op) >= first]
+    return letters
+
+
+def _viable(n, prefix, symmetries):
+    """
+    Protected Function
+    Whether a prefix survives the pruning of words().
+    """
+    return all(prefix[i] in _letters(n, prefix[:i], symmetries) for i in range(len(prefix)))
+
+
+def words(n, max_length, min_length = 1, symmetries = (), prefix = ()):
+    """
+    Yields the braid words on n strands up to a given length.
+
+    Parameters
+    ----------
+    n : int
+        Braid group.
+    max_length : int
+        Longest word.
+    min_length : int (Default = 1)
+        Shortest word.
+    symmetries : iterable (Default = ())
+        Symmetries, from SYMMETRIES, under which only the least word of
+        each orbit is yielded.
+    prefix : tuple (Default = ())
+        Only yields the words starting with this prefix.
+
+    Yields
+    ------
+    ops : tuple
+        Freely reduced braid word, in letter order.
+
+    Notes
+    -----
+    The symmetries are equivalences of the words only: rotating,
+    reversing or mirroring a kernel's word can change its Alexander
+    Data, since the caps and the "y" strand pin the ends of the braid.
+    Prune them only when the search treats such kernels as equivalent.
+
+    """
+    symmetries = _check_symmetries(symmetries)
+    if n < 2:
+        raise ValueError("Braid group must have at least two strands.")
+    prefix = tuple(int(op) for op in prefix)
+    if not _viable(n, prefix, symmetries):
+        return
+
+    stack = [prefix]
+    while stack:
+        ops = stack.pop()
+        if len(ops) >= min_length and _canonical(ops, symmetries):
+            yield ops
+        if len(ops) < max_length:
+            stack.extend(ops + (op,) for op in reversed(_letters(n, ops, symmetries)))
+
+
+class Numeric_Screen():
+    """
+    Screen passing the kernels whose Alexander polynomial, with every
+    strand variable set to the same value, matches a target's at a few
+    fixed points.
+
+    Parameters
+    ----------
+    target : Braid_Kernel or array_like
+        The kernel searched for, or its values from values().
+    rtol, atol : float (Default = 1e-8, 1e-10)
+        Tolerances of the comparison, see numpy.allclose().
+
+    Notes
+    -----
+    Setting every strand variable to the same value makes the screen
+    independent of how strand classes are numbered. Any kernel with the
+    target's Alexander polynomial passes, so the screen only discards;
+    survivors are confirmed with the exact pipeline.
+
+    """
+    def __init__(self, target, rtol = 1e-8, atol = 1e-10):
+        self.target = self.values(target) if isinstance(target, Braid_Kernel) else np.asarray(target)
+        self.rtol = rtol
+        self.atol = atol
+
+    @staticmethod
+    def values(kernel):
+        """
+        Alexander polynomial of a kernel at the screen's points.
+        """
+        points = np.array([[x] + [t] * (len(kernel.variables()) - 1) for x, t in _POINTS])
+        return kernel.alexander_polynomial_numeric(points)
+
+    def __call__(self, kernel):
+        return np.allclose(self.values(kernel), self.target, rtol = self.rtol, atol = self.atol)
+
+
+def _run_prefix(n, k, prefix, max_length, min_length, symmetries, screen):
+    """
+    Protected Function
+    Builds and screens the kernel of every word below a prefix.
+    """
+    dtype = _word_dtype(n)
+    hits = []
+    for ops in words(n, max_length, min_length, symmetries, prefix):
+        kernel = Braid_Kernel.from_array(n, k, np.array(ops, dtype = dtype))
+        if screen is None or screen(kernel):
+            hits.append((n, k, ops))
+    return hits
+
+
+def search(n, k, max_length, min_length = 1, screen = None, symmetries = (), jobs = None, depth = 2):
+    """
+    Yields the kernels on n strands with k caps, up to a given word
+    length, that pass a screen.
+
+    Parameters
+    ----------
+    n : int
+        Braid group.
+    k : int
+        Number of caps.
+    max_length : int
+        Longest word.
+    min_length : int (Default = 1)
+        Shortest word.
+    screen : callable or None (Default = None)
+        screen(kernel) returns True for the kernels to keep, e.g. a
+        Numeric_Screen. It must be picklable to run in workers. None
+        keeps every kernel.
+    symmetries : iterable (Default = ())
+        Symmetries pruned, see words().
+    jobs : int or None (Default = None)
+        Worker processes; None or 1 runs in this process.
+    depth : int (Default = 2)
+        Length of the prefixes the space is sharded by. Deeper prefixes
+        make more, smaller, tasks.
+
+    Yields
+    ------
+    spec : tuple
+        (n, k, ops) of each kernel kept, ready for batch.compute(), in
+        the order words() generates them.
+
+    """
+    symmetries = _check_symmetries(symmetries)
+    if k > n / 2:
+        raise ValueError("Number of caps cannot exceed half of total number of strands.")
+    if depth < 1:
+        raise ValueError("Prefix depth must be positive.")
+    depth = min(depth, max_length)
+
+    # Words shorter than the prefixes are run here
+    args = (max_length, min_length, symmetries, screen)
+    yield from _run_prefix(n, k, (), depth - 1, min_length, symmetries, screen)
+    prefixes = [ops for ops in words(n, depth, depth, ()) if _viable(n, ops, symmetries)]
+
+    if jobs is None or jobs <= 1:
+        for prefix in prefixes:
+            yield from _run_prefix(n, k, prefix, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers = jobs) as pool:
+        futures = [pool.submit(_run_prefix, n, k, prefix, *args) for prefix in prefixes]
+        for future in futures:
+            yield from future.result()
+
@@ -0,0 +1,352 @@
+"""
+Invariant Index
+===============
+Hash index of Alexander Data, for finding the kernels of a catalogue
+that may be the same textile.
+
+Each invariant (U, V, data), as returned by Braid_Kernel.alexander_data(),
+gets two keys:
+
+- A fingerprint: every entry of the coefficient grid evaluated with all
+  strand variables set to the same point, modulo a large prime, along
+  with the grid size and the total exponents of U and V. It is cheap
+  and does not depend on how the strand variables are numbered.
+- A canonical hash: a digest of the exact invariant, with the strand
+  variables renumbered into a canonical order, so that kernels whose
+  Alexander Data differ only in the numbering of their strand classes
+  hash alike.
+
+The fingerprint is a prefilter: lookups only compute the canonical hash
+when some catalogued invariant shares the fingerprint. Lookups and
+insertions are dictionary operations, so indexing and clustering a
+catalogue is linear in its size.
+
+"""
+
+# Dependent Libraries
+import hashlib
+from itertools import permutations, product
+
+from .batch import compute
+from .serialise import _sympy_terms
+
+
+__all__ = [
+    "Invariant_Index",
+    "canonical_hash",
+    "fingerprint"
+]
+
+
+# Mersenne prime modulus and evaluation points of the fingerprint
+_MODULUS = 2**61 - 1
+_POINTS = (1234567891, 987654321987)
+
+
+def _parse(invariant):
+    """
+    Protected Function
+    Reads an invariant into plain integer terms.
+
+    Parameters
+    ----------
+    invariant : tuple or dict
+        (U, V, data) as returned by Braid_Kernel.alexander_data(), or a
+        dict with keys "U", "V" and "data" as returned by
+        batch.compute().
+
+    Returns
+    -------
+    size : int
+        Size of the coefficient grid.
+    a, b : dict
+        Exponent of each strand variable in U and in V.
+    cells : dict
+        Maps each non-zero grid position (j, i) to its terms, a list of
+        (exponent dict, coefficient).
+
+    """
+    if isinstance(invariant, dict):
+        U, V, data = invariant["U"], invariant["V"], invariant["data"]
+    else:
+        U, V, data = invariant
+    if data.rows != data.cols:
+        raise ValueError("Coefficient grid must be square, got shape " + str(data.shape) + ".")
+
+    a = {str(base): int(e) for base, e in U.as_powers_dict().items() if str(base) != "y" and e != 0}
+    b = {str(base): int(e) for base, e in V.as_powers_dict().items() if str(base) != "x" and e != 0}
+    cells = {}
+    for j in range(data.rows):
+        for i in range(data.cols):
+            if data[j, i] != 0:
+                cells[j, i] = _sympy_terms(data[j, i])
+    return data.rows, a, b, cells
+
+
+def _fingerprint(size, a, b, cells):
+    """
+    Protected Function
+    Fingerprint of a parsed invariant, see fingerprint().
+    """
+    values = []
+    for (j, i), terms in sorted(cells.items()):
+        for point in _POINTS:
+            value = sum(c * pow(point, sum(powers.values()), _MODULUS) for powers, c in terms) % _MODULUS
+            values.append((j, i, value))
+    h = hashlib.blake2b(digest_size = 8)
+    h.update(repr((size, sum(a.values()), sum(b.values()), values)).encode())
+    return h.digest()
+
+
+def _canonical_hash(size, a, b, cells, max_orderings):
+    """
+    Protected Function
+    Canonical hash of a parsed invariant, see canonical_hash().
+    """
+    names = set(a) | set(b) | {v for terms in cells.values() for powers, _ in terms for v in powers}
+
+    # Variables told apart by their own exponents are ordered by them;
+    # only variables that tie are permuted.
+    def signature(v):
+        return (a.get(v, 0), b.get(v, 0),
+                sorted((j, i, powers.get(v, 0), c) for (j, i), terms in cells.items() for powers, c in terms))
+
+    signatures = {v: signature(v) for v in names}
+    ordered = sorted(names, key = lambda v: (signatures[v], v))
+    ties = []
+    for v in ordered:
+        if ties and signatures[ties[-1][0]] == signatures[v]:
+            ties[-1].append(v)
+        else:
+            ties.append([v])
+
+    count = 1
+    for group in ties:
+        for m in range(2, len(group) + 1):
+            count *= m
+    orderings = product(*[permutations(group) for group in ties]) if count <= max_orderings else [[ordered]]
+
+    best = None
+    for groups in orderings:
+        order = [v for group in groups for v in group]
+        encoding = (size, tuple(a.get(v, 0) for v in order), tuple(b.get(v, 0) for v in order),
+                    tuple((j, i, tuple(sorted((tuple(powers.get(v, 0) for v in order), c) for powers, c in terms)))
+                          for (j, i), terms in sorted(cells.items())))
+        if best is None or encoding < best:
+            best = encoding
+
+    h = hashlib.blake2b(digest_size = 16)
+    h.update(repr(best).encode())
+    return h.digest()
+
+
+def fingerprint(invariant):
+    """
+    Cheap prefilter key of an invariant.
+
+    Parameters
+    ----------
+    invariant : tuple or dict
+        (U, V, data) as returned by Braid_Kernel.alexander_data(), or
+        the "data" stage result of batch.compute().
+
+    Returns
+    -------
+    key : bytes
+        8 byte digest of the grid size, the total exponents of U and V,
+        and every grid entry evaluated with all strand variables at two
+        fixed points modulo 2**61 - 1.
+
+    Notes
+    -----
+    Equal invariants always have equal fingerprints; unequal ones almost
+    never do.
+
+    """
+    return _fingerprint(*_parse(invariant))
+
+
+def canonical_hash(invariant, max_orderings = 5040):
+    """
+    Digest of an invariant up to the numbering of its strand variables.
+
+    Parameters
+    ----------
+    invariant : tuple or dict
+        (U, V, data) as returned by Braid_Kernel.alexander_data(), or
+        the "data" stage result of batch.compute().
+    max_orderings : int (Default = 5040)
+        Largest number of orderings of tied strand variables tried.
+
+    Returns
+    -------
+    key : bytes
+        16 byte digest.
+
+    Notes
+    -----
+    Strand variables are ordered by their exponents in U, V and every
+    term of the grid; the encoding is the least over the orderings of
+    variables that still tie. Past max_orderings only the sorted order
+    is used, so invariants with many interchangeable strand classes may
+    hash apart even when they match.
+
+    """
+    return _canonical_hash(*_parse(invariant), max_orderings)
+
+
+class Invariant_Index():
+    """
+    Hash index from Alexander Data to the catalogue keys that have it.
+
+    Parameters
+    ----------
+    max_orderings : int (Default = 5040)
+        See canonical_hash().
+
+    Notes
+    -----
+    Keys can be any hashable object, e.g. a kernel spec (n, k, ops) or
+    a catalogue id. Matching invariants are evidence, not proof, that
+    two kernels are the same textile.
+
+    """
+    def __init__(self, max_orderings = 5040):
+        self.max_orderings = max_orderings
+        self._buckets = {}
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def signature(self, invariant):
+        """
+        (fingerprint, canonical hash) of an invariant.
+        """
+        parsed = _parse(invariant)
+        return _fingerprint(*parsed), _canonical_hash(*parsed, self.max_orderings)
+
+    def add(self, key, invariant):
+        """
+        Catalogues an invariant under key, replacing any earlier entry
+        for that key.
+        """
+        if key in self._entries:
+            self.remove(key)
+        fp, digest = self.signature(invariant)
+        self._buckets.setdefault(fp, {}).setdefault(digest, []).append(key)
+        self._entries[key] = (fp, digest)
+
+    def add_kernel(self, key, kernel, **options):
+        """
+        Catalogues the Alexander Data of a Braid_Kernel under key.
+        Options are passed on to alexander_data().
+        """
+        self.add(key, kernel.alexander_data(print_result = False, **options))
+
+    def remove(self, key):
+        """
+        Removes the entry of key.
+        """
+        fp, digest = self._entries.pop(key)
+        bucket = self._buckets[fp]
+        bucket[digest].remove(key)
+        if not bucket[digest]:
+            del bucket[digest]
+        if not bucket:
+            del self._buckets[fp]
+
+    def update(self, records):
+        """
+        Catalogues the records of batch.compute(stage = "data"), each
+        under its spec.
+
+        Returns
+        -------
+        failed : list
+            The records that have no result.
+
+        """
+        failed = []
+        for record in records:
+            if record["status"] == "ok":
+                self.add(record["spec"], record["result"])
+            else:
+                failed.append(record)
+        return failed
+
+    def find(self, invariant):
+        """
+        Keys of every catalogued invariant equal to this one, up to the
+        numbering of the strand variables.
+        """
+        parsed = _parse(invariant)
+        bucket = self._buckets.get(_fingerprint(*parsed))
+        if bucket is None:
+            return []
+        return list(bucket.get(_canonical_hash(*parsed, self.max_orderings), ()))
+
+    def find_kernel(self, kernel, **options):
+        """
+        Keys of every catalogued invariant equal to the Alexander Data
+        of a Braid_Kernel. Options are passed on to alexander_data().
+        """
+        return self.find(kernel.alexander_data(print_result = False, **options))
+
+    def lookup(self, key):
+        """
+        Keys sharing the invariant catalogued under key, key included.
+        """
+        fp, digest = self._entries[key]
+        return list(self._buckets[fp][digest])
+
+    def groups(self, min_size = 2):
+        """
+        Clusters of keys with equal invariants.
+
+        Parameters
+        ----------
+        min_size : int (Default = 2)
+            Smallest cluster returned; 1 returns every cluster.
+
+        Returns
+        -------
+        groups : list
+            Lists of keys, in the order they were added.
+
+        """
+        return [list(keys) for bucket in self._buckets.values() for keys in bucket.values() if len(keys) >= min_size]
+
+    @classmethod
+    def from_catalogue(cls, specs, jobs = None, chunksize = 1, timeout = None, cache = None, max_orderings = 5040,
+                       **options):
+        """
+        Computes and indexes the Alexander Data of a catalogue of kernel
+        specs, each catalogued under its (n, k, ops) spec.
+
+        Parameters
+        ----------
+        specs : iterable or str or os.PathLike
+            Kernel specs, see batch.read_specs().
+        jobs, chunksize, timeout, cache
+            See batch.compute().
+        max_orderings : int (Default = 5040)
+            See canonical_hash().
+        **options
+            Passed on to alexander_data(), e.g. method = "bareiss".
+
+        Returns
+        -------
+        index : Invariant_Index
+            The catalogued invariants.
+        failed : list
+            Records of the kernels that failed or timed out.
+
+        """
+        index = cls(max_orderings)
+        failed = index.update(compute(specs, jobs = jobs, chunksize = chunksize, ordered = False, timeout = timeout,
+                                      stage = "data", cache = cache, **options))
+        return index, failed
@@ -0,0 +1,202 @@
+"""
+Instrumentation
+===============
+Opt-in structured events from the stages of the Braid_Kernel pipeline,
+see Braid_Kernel.instrument().
+
+Every event is a dict with at least:
+
+- "stage": "burau", "burau_crossing", "matrix", "determinant",
+  "linking", "substitution" or "coefficients".
+- "seconds": wall time of the stage.
+- "memory": change in traced memory over the stage, in bytes, or None
+  if tracemalloc is not tracing.
+- "terms": number of terms of the stage's result once expanded; for
+  "burau_crossing" events, of the running product as it stands, which
+  is not expanded so as not to slow the accumulation down.
+- "ops": SymPy count_ops() of the same result, if asked for, else
+  None.
+
+Stages answered from the Kernel's cache emit a single event with
+"cached" set to True and no measurements.
+
+"""
+
+# Dependent Libraries
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from ._lazy import sp
+from .laurent import Laurent_Matrix
+
+
+__all__ = [
+    "Instrument",
+    "expression_size"
+]
+
+
+def expression_size(result, count_ops = False, expand = True):
+    """
+    Size of a pipeline result.
+
+    Parameters
+    ----------
+    result : SymPy expression or Matrix, Laurent_Matrix, dict, tuple
+        The result; a dict is taken as a sparse polynomial, mapping
+        tuples of exponents (or packed monomials) to coefficients, a
+        tuple as several results.
+    count_ops : boolean (Default = False)
+        Also counts SymPy operations, which can be slow.
+    expand : boolean (Default = True)
+        Expands SymPy results before counting. Expanding a large
+        matrix costs far more than building it.
+
+    Returns
+    -------
+    terms : int
+        Number of terms of the (expanded) result, summed over the
+        entries of a matrix.
+    ops : int or None
+        SymPy count_ops() of the (expanded) result, if asked for, or None
+        for Laurent_Matrix and packed dict results.
+
+    Notes
+    -----
+    SymPy results are expanded to count their terms, as the "sympy"
+    determinant is left as a product or quotient.
+
+    """
+    if isinstance(result, tuple):
+        sizes = [expression_size(r, count_ops, expand) for r in result]
+        return sum(t for t, _ in sizes), (sum(o or 0 for _, o in sizes) if count_ops else None)
+    if isinstance(result, dict):
+        if not count_ops or not all(isinstance(key, tuple) for key in result):
+            return len(result), None
+        # Operations of the same polynomial over stand-in symbols
+        gens = sp.symbols("v0:" + str(max((len(key) for key in result), default = 0)))
+        expr = sp.Add(*[c * sp.Mul(*[g**e for g, e in zip(gens, key)]) for key, c in result.items()])
+        return len(result), int(sp.count_ops(expr))
+    if isinstance(result, Laurent_Matrix):
+        return sum(len(p) for row in result.rows for p in row), None
+    if isinstance(result, sp.MatrixBase):
+        if expand:
+            result = result.applyfunc(sp.expand)
+        terms = sum(len(sp.Add.make_args(e)) for e in result if e != 0)
+    elif isinstance(result, sp.Basic):
+        if expand:
+            result = sp.expand(result)
+        terms = len(sp.Add.make_args(result)) if result != 0 else 0
+    else:
+        return 0, None
+    return terms, (int(sp.count_ops(result)) if count_ops else None)
+
+
+class Instrument():
+    """
+    Collects, or forwards, the events of an instrumented Braid_Kernel.
+
+    Parameters
+    ----------
+    callback : callable or None (Default = None)
+        Called with each event as it happens. Events are also kept in
+        the 'events' list.
+    memory : boolean (Default = False)
+        Traces memory with tracemalloc while attached, if it is not
+        already tracing. This slows the pipeline down noticeably.
+    count_ops : boolean (Default = False)
+        Adds SymPy's count_ops() of each result to its event.
+    crossings : boolean (Default = True)
+        Emits an event for every crossing of the Burau accumulation,
+        counting the terms of the product without expanding it.
+
+    Notes
+    -----
+    SymPy is imported by start(), so that its import is not measured
+    as part of the first stage.
+
+    """
+    def __init__(self, callback = None, memory = False, count_ops = False, crossings = True):
+        self.callback = callback
+        self.memory = memory
+        self.count_ops = count_ops
+        self.crossings = crossings
+        self.events = []
+        self._tracing = False
+        self._last = None
+        self._memory = None
+
+    def start(self):
+        """
+        Imports SymPy, then starts tracing memory, if asked for.
+        """
+        # Loads the lazy module
+        sp.Basic
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    def stop(self):
+        """
+        Stops tracing memory, if started by start().
+        """
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def emit(self, event):
+        """
+        Records an event and passes it to the callback.
+        """
+        self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+
+    @staticmethod
+    def _traced():
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+    @contextmanager
+    def stage(self, name, **fields):
+        """
+        Measures a stage. The body stores its result under "result" in
+        the yielded dict; any other fields it adds go into the event.
+        """
+        record = {}
+        memory = self._traced()
+        start = time.perf_counter()
+        self._last = start
+        self._memory = memory
+        yield record
+        seconds = time.perf_counter() - start
+        after = self._traced()
+
+        terms, ops = expression_size(record.get("result"), self.count_ops)
+        event = {"stage": name, "seconds": seconds, "memory": None if memory is None or after is None else after - memory,
+                 "terms": terms, "ops": ops}
+        event.update(fields)
+        event.update((key, value) for key, value in record.items() if key != "result")
+        self.emit(event)
+
+    def crossing(self, index, op, mat):
+        """
+        Emits the event of one crossing of the Burau accumulation, timed
+        from the previous crossing, or the start of the stage.
+        """
+        if not self.crossings:
+            return
+        now = time.perf_counter()
+        memory = self._traced()
+        terms, ops = expression_size(mat, self.count_ops, expand = False)
+        self.emit({"stage": "burau_crossing", "seconds": now - self._last,
+                   "memory": None if memory is None or self._memory is None else memory - self._memory,
+                   "terms": terms, "ops": ops, "index": index, "op": op})
+        self._memory = memory
+        self._last = time.perf_counter()
+
+    def cached(self, name):
+        """
+        Emits the event of a stage answered from the Kernel's cache.
+        """
+        self.emit({"stage": name, "seconds": 0.0, "memory": None, "terms": None, "ops": None, "cached": True})
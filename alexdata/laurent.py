@@ -0,0 +1,460 @@
+"""
+Laurent Polynomial Engine
+=========================
+Sparse multivariate Laurent polynomials with integer coefficients,
+and matrices over them, for the symbolic stages of the Alexander
+Data calculation.
+
+A polynomial is held as a plain dictionary mapping a packed exponent
+vector to its (non-zero) integer coefficient. Each exponent is stored,
+offset by a fixed bias, in its own fixed-width bit field of a single
+Python int; multiplying two monomials is then one integer addition
+rather than a walk over an exponent tuple. Results are only turned
+into SymPy objects when asked for.
+
+"""
+
+# Dependent Libraries
+import heapq
+
+from ._lazy import sp
+
+
+__all__ = [
+    "Laurent_Ring",
+    "Laurent_Matrix"
+]
+
+
+# Bit width of a single packed exponent field, and the bias that
+# centres the field so negative exponents can be stored.
+_SHIFT = 20
+_BIAS = 1 << (_SHIFT - 1)
+_MASK = (1 << _SHIFT) - 1
+
+
+class Laurent_Ring():
+    """
+    Ring of sparse Laurent polynomials over the integers in a fixed,
+    ordered set of variables.
+
+    Attributes
+    ----------
+    variables : tuple
+        Names of the ring's variables, in packing order.
+
+    Notes
+    -----
+    Polynomials belonging to the ring are plain dictionaries of the
+    form {packed exponent : integer coefficient}. The zero polynomial
+    is the empty dictionary. Ring methods never modify their inputs.
+
+    """
+    def __init__(self, variables):
+        """
+        Initialises the Laurent_Ring with the given variable names.
+        """
+        self.variables = tuple(variables)
+        self._index = {v: i for i, v in enumerate(self.variables)}
+        # Packed key of the constant monomial 1
+        self._offset = sum(_BIAS << (_SHIFT * i) for i in range(len(self.variables)))
+
+    def __eq__(self, other):
+        return isinstance(other, Laurent_Ring) and self.variables == other.variables
+
+    def __hash__(self):
+        return hash(self.variables)
+
+    def __reduce__(self):
+        return (Laurent_Ring, (self.variables,))
+
+    def pack(self, exponents):
+        """
+        Packs a sequence of exponents (one per variable) into a key.
+        """
+        key = 0
+        for i, e in enumerate(exponents):
+            key += (e + _BIAS) << (_SHIFT * i)
+        return key
+
+    def unpack(self, key):
+        """
+        Unpacks a key into a tuple of exponents, one per variable.
+        """
+        return tuple(((key >> (_SHIFT * i)) & _MASK) - _BIAS for i in range(len(self.variables)))
+
+    def one(self):
+        """
+        Returns the constant polynomial 1.
+        """
+        return {self._offset: 1}
+
+    def gen(self, name, power = 1, coeff = 1):
+        """
+        Returns the monomial coeff*name**power.
+        """
+        return {self._offset + (power << (_SHIFT * self._index[name])): coeff}
+
+    def add(self, p, q):
+        """
+        Returns p + q.
+        """
+        if len(p) < len(q):
+            p, q = q, p
+        r = dict(p)
+        for k, c in q.items():
+            c += r.get(k, 0)
+            if c:
+                r[k] = c
+            else:
+                del r[k]
+        return r
+
+    def neg(self, p):
+        """
+        Returns -p.
+        """
+        return {k: -c for k, c in p.items()}
+
+    def sub(self, p, q):
+        """
+        Returns p - q.
+        """
+        return self.add(p, self.neg(q))
+
+    def mul(self, p, q):
+        """
+        Returns p * q.
+        """
+        if not p or not q:
+            return {}
+        if len(p) < len(q):
+            p, q = q, p
+        off = self._offset
+        r = {}
+        get = r.get
+        for kb, cb in q.items():
+            kb -= off
+            for ka, ca in p.items():
+                k = ka + kb
+                r[k] = get(k, 0) + ca * cb
+        return {k: c for k, c in r.items() if c}
+
+    def truncate(self, p, limits):
+        """
+        Returns p without the terms whose exponent in any limited
+        variable exceeds its limit.
+
+        Parameters
+        ----------
+        limits : dict
+            Mapping of variable name to largest exponent kept.
+
+        """
+        checks = [(_SHIFT * self._index[v], _BIAS + e) for v, e in limits.items()]
+        return {k: c for k, c in p.items() if all((k >> shift) & _MASK <= top for shift, top in checks)}
+
+    def shift(self, p, key):
+        """
+        Returns p multiplied by the monomial with packed key 'key'.
+        """
+        key -= self._offset
+        return {k + key: c for k, c in p.items()}
+
+    def exquo(self, p, q):
+        """
+        Returns the exact quotient p / q.
+
+        Raises
+        ------
+        ValueError
+            If q does not divide p exactly.
+
+        Notes
+        -----
+        Packed keys compare as exponent vectors under a lexicographic
+        order that is compatible with multiplication, so the leading
+        term of the quotient is always the leading term of the
+        remainder divided by the leading term of q. The remainder's
+        terms are visited largest first through a heap. An exact
+        quotient has no term below min(p) / min(q), so the division
+        stops there rather than running on through ever smaller Laurent
+        terms.
+
+        """
+        if not q:
+            raise ZeroDivisionError("Polynomial division by zero.")
+        if not p:
+            return {}
+        off = self._offset
+        lead = max(q)
+        lead_c = q[lead]
+
+        # Division by a monomial
+        if len(q) == 1:
+            r = {}
+            for k, c in p.items():
+                c, rem = divmod(c, lead_c)
+                if rem:
+                    raise ValueError("Polynomial division is not exact.")
+                r[k - lead + off] = c
+            return r
+
+        # Least shift of an exact quotient's terms
+        floor = min(p) - min(q)
+        rem = dict(p)
+        heap = [-k for k in rem]
+        heapq.heapify(heap)
+        quot = {}
+        while rem:
+            k = -heapq.heappop(heap)
+            if k not in rem:
+                continue
+            shift = k - lead
+            c, r = divmod(rem[k], lead_c)
+            if r or shift < floor:
+                raise ValueError("Polynomial division is not exact.")
+            quot[shift + off] = c
+            for kq, cq in q.items():
+                kk = kq + shift
+                v = rem.get(kk, 0) - c*cq
+                if v:
+                    if kk not in rem:
+                        heapq.heappush(heap, -kk)
+                    rem[kk] = v
+                else:
+                    rem.pop(kk, None)
+        return quot
+
+    def to_sympy(self, p):
+        """
+        Converts the polynomial p into an (expanded) SymPy expression.
+        """
+        syms = [sp.Symbol(v) for v in self.variables]
+        terms = []
+        for key, c in p.items():
+            term = [sp.Integer(c)]
+            for s, e in zip(syms, self.unpack(key)):
+                if e:
+                    term.append(s**e)
+            terms.append(sp.Mul(*term))
+        return sp.Add(*terms)
+
+
+class Laurent_Matrix():
+    """
+    Dense matrix whose entries are sparse Laurent polynomials of a
+    shared Laurent_Ring.
+
+    Attributes
+    ----------
+    ring : Laurent_Ring
+        The ring the matrix entries belong to.
+    rows : list[list[dict]]
+        Row-major list of polynomial entries.
+
+    """
+    def __init__(self, ring, rows):
+        """
+        Initialises the Laurent_Matrix from a ring and its rows.
+        """
+        self.ring = ring
+        self.rows = rows
+
+    @classmethod
+    def identity(cls, ring, n):
+        """
+        Returns the n x n identity matrix over the given ring.
+        """
+        return cls(ring, [[ring.one() if i == j else {} for j in range(n)] for i in range(n)])
+
+    @property
+    def shape(self):
+        """
+        (Number of rows, number of columns) of the matrix.
+        """
+        return (len(self.rows), len(self.rows[0]) if self.rows else 0)
+
+    def copy(self):
+        """
+        Returns a copy of the matrix. Entries are shared, as ring
+        operations never modify polynomials in place.
+        """
+        return Laurent_Matrix(self.ring, [row[:] for row in self.rows])
+
+    def __mul__(self, other):
+        """
+        Matrix product, skipping zero entries.
+        """
+        ring = self.ring
+        add = ring.add
+        mul = ring.mul
+        m = other.shape[1]
+        rows = []
+        for row in self.rows:
+            new = [{} for _ in range(m)]
+            for k, a in enumerate(row):
+                if not a:
+                    continue
+                for j, b in enumerate(other.rows[k]):
+                    if b:
+                        new[j] = add(new[j], mul(a, b))
+            rows.append(new)
+        return Laurent_Matrix(ring, rows)
+
+    def right_mul_row(self, row, entries):
+        """
+        Right-multiplies the matrix, in place, by the identity matrix
+        with row 'row' replaced by 'entries'.
+
+        Parameters
+        ----------
+        row : int
+            Index of the only row that differs from the identity.
+        entries : dict
+            Mapping of column index to the polynomial in that column of
+            the replaced row. Missing columns are zero.
+
+        Notes
+        -----
+        Only the columns named in 'entries' (and column 'row') change,
+        so this costs O(n) ring operations rather than the O(n^3) of a
+        full product.
+
+        """
+        ring = self.ring
+        add = ring.add
+        mul = ring.mul
+        diag = entries.get(row, {})
+        for r in self.rows:
+            a = r[row]
+            if not a:
+                continue
+            for col, g in entries.items():
+                if col != row:
+                    r[col] = add(r[col], mul(a, g))
+            r[row] = mul(a, diag)
+
+    def clear_denominators(self):
+        """
+        Multiplies each row through by the smallest monomial that leaves
+        only non-negative exponents in that row.
+
+        Returns
+        -------
+        mat : Laurent_Matrix
+            The row-scaled, polynomial, matrix.
+        key : int
+            Packed key of the product of all row monomials, so that
+            det(self) = det(mat) / key.
+
+        """
+        ring = self.ring
+        nvars = len(ring.variables)
+        total = ring._offset
+        rows = []
+        for row in self.rows:
+            keys = [k for p in row for k in p]
+            if not keys:
+                rows.append(row[:])
+                continue
+            mins = [min(e) for e in zip(*(ring.unpack(k) for k in keys))] if nvars else []
+            key = ring.pack([-e for e in mins])
+            rows.append([ring.shift(p, key) for p in row])
+            total += key - ring._offset
+        return Laurent_Matrix(ring, rows), total
+
+    def det(self, truncate = None):
+        """
+        Determinant of the (square) matrix by fraction-free Bareiss
+        elimination.
+
+        Parameters
+        ----------
+        truncate : dict or None (Default = None)
+            Mapping of variable name to the largest exponent of that
+            variable wanted in the determinant. The other terms are
+            dropped once the exact determinant is computed in full.
+
+        Returns
+        -------
+        det : dict
+            The determinant as a polynomial of the matrix's ring.
+
+        Notes
+        -----
+        Laurent denominators are first cleared row by row, so that the
+        elimination runs over the polynomial ring, and the row monomials
+        are divided back out at the end. At each step the pivot is the
+        non-zero entry of the remaining block with the fewest terms;
+        every Bareiss division is exact. Truncating the entries would
+        break that exactness, so only the result is truncated.
+
+        """
+        ring = self.ring
+        n, m = self.shape
+        if n != m:
+            raise ValueError("Determinant requires a square matrix.")
+        if n == 0:
+            return ring.one()
+
+        mat, key = self.clear_denominators()
+        A = mat.rows
+        add = ring.add
+        mul = ring.mul
+        neg = ring.neg
+        exquo = ring.exquo
+
+        sign = 1
+        prev = ring.one()
+        for k in range(n):
+            # Sparsest non-zero pivot in the remaining block
+            pivot = None
+            for i in range(k, n):
+                for j in range(k, n):
+                    p = A[i][j]
+                    if p and (pivot is None or len(p) < len(A[pivot[0]][pivot[1]])):
+                        pivot = (i, j)
+            if pivot is None:
+                return {}
+            i, j = pivot
+            if i != k:
+                A[i], A[k] = A[k], A[i]
+                sign = -sign
+            if j != k:
+                for row in A:
+                    row[j], row[k] = row[k], row[j]
+                sign = -sign
+
+            akk = A[k][k]
+            for i in range(k + 1, n):
+                aik = A[i][k]
+                for j in range(k + 1, n):
+                    p = mul(A[i][j], akk)
+                    if aik and A[k][j]:
+                        p = add(p, neg(mul(aik, A[k][j])))
+                    A[i][j] = exquo(p, prev)
+                A[i][k] = {}
+            prev = akk
+
+        det = A[n - 1][n - 1]
+        if sign < 0:
+            det = neg(det)
+        # Divide out the row monomials
+        det = ring.shift(det, 2*ring._offset - key)
+        if truncate is not None:
+            det = ring.truncate(det, truncate)
+        return det
+
+    def submatrix(self, rows, cols):
+        """
+        Returns the submatrix made of the given row and column indices.
+        """
+        return Laurent_Matrix(self.ring, [[self.rows[i][j] for j in cols] for i in rows])
+
+    def to_sympy(self):
+        """
+        Converts the matrix into a SymPy Matrix.
+        """
+        to_sympy = self.ring.to_sympy
+        return sp.Matrix([[to_sympy(p) for p in row] for row in self.rows])
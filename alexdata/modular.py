@@ -0,0 +1,415 @@
+"""
+Modular Determinant
+===================
+Determinants of Laurent_Matrix objects by evaluation, interpolation
+and Chinese remaindering.
+
+The matrix is evaluated on a grid of integer points modulo several
+word-sized primes, each batch of evaluated matrices is reduced with
+vectorised NumPy integer Gaussian elimination, the determinant's values
+are interpolated back into a dense multivariate polynomial modulo each
+prime, and the integer coefficients are recovered with the Chinese
+remainder theorem. The evaluated matrices are bounded by the chunk
+size; the grid of values, one per point and prime, is not, see
+modular_det(). Every prime is independent of the others.
+
+"""
+
+# Dependent Libraries
+from concurrent.futures import ProcessPoolExecutor
+from math import prod
+
+import numpy as np
+
+
+__all__ = [
+    "modular_det"
+]
+
+
+# Primes are kept below 2**31 so that the product of two residues, plus
+# one more residue, always fits in a signed 64 bit integer.
+_PRIME_LIMIT = 2**31
+_PRIMES = []
+
+
+def _is_prime(m):
+    """
+    Protected Function
+    Deterministic Miller-Rabin test, exact for m < 3,215,031,751.
+    """
+    if m < 2:
+        return False
+    for p in (2, 3, 5, 7):
+        if m % p == 0:
+            return m == p
+    d, s = m - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7):
+        x = pow(a, d, m)
+        if x in (1, m - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == m - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primes(count):
+    """
+    Protected Function
+    Returns the 'count' largest primes below _PRIME_LIMIT.
+    """
+    m = _PRIMES[-1] - 2 if _PRIMES else _PRIME_LIMIT - 1
+    while len(_PRIMES) < count:
+        if _is_prime(m):
+            _PRIMES.append(m)
+        m -= 2
+    return _PRIMES[:count]
+
+
+def _pow_mod(a, e, p):
+    """
+    Protected Function
+    Elementwise a**e mod p for an int64 array 'a'.
+    """
+    result = np.ones_like(a)
+    base = a % p
+    while e:
+        if e & 1:
+            result = result * base % p
+        base = base * base % p
+        e >>= 1
+    return result
+
+
+def _batched_det_mod(A, p):
+    """
+    Protected Function
+    Determinants, modulo p, of a batch of matrices A of shape
+    (N, m, m) by Gaussian elimination with per-matrix row pivoting.
+    A is overwritten.
+    """
+    N, m, _ = A.shape
+    det = np.ones(N, dtype = np.int64)
+    batch = np.arange(N)
+    for k in range(m):
+        # First non-zero entry on or below the diagonal of each matrix
+        piv = np.argmax(A[:, k:, k] != 0, axis = 1) + k
+        swap = piv != k
+        if swap.any():
+            rows = A[batch, k].copy()
+            A[batch, k] = A[batch, piv]
+            A[batch, piv] = rows
+            det = np.where(swap, (p - det) % p, det)
+
+        pivot = A[:, k, k]
+        det = det * pivot % p
+        if k + 1 == m:
+            break
+        # Singular matrices have a zero pivot, and so a zero inverse
+        inv = _pow_mod(pivot, p - 2, p)
+        factor = A[:, k + 1:, k] * inv[:, None] % p
+        A[:, k + 1:, k:] = (A[:, k + 1:, k:] - factor[:, :, None] * A[:, None, k, k:]) % p
+    return det
+
+
+def _inverse_vandermonde(points, p):
+    """
+    Protected Function
+    Inverse, modulo p, of the Vandermonde matrix V[i, j] = points[i]**j,
+    by Gauss-Jordan elimination on Python ints.
+    """
+    d = len(points)
+    M = [[pow(a, j, p) for j in range(d)] + [int(i == r) for r in range(d)] for i, a in enumerate(points)]
+    for k in range(d):
+        piv = next(i for i in range(k, d) if M[i][k])
+        M[k], M[piv] = M[piv], M[k]
+        inv = pow(M[k][k], p - 2, p)
+        M[k] = [v * inv % p for v in M[k]]
+        for i in range(d):
+            if i != k and M[i][k]:
+                f = M[i][k]
+                M[i] = [(a - f * b) % p for a, b in zip(M[i], M[k])]
+    return np.array([row[d:] for row in M], dtype = np.int64)
+
+
+def _det_mod_prime(terms, m, degrees, lows, p, chunk_size):
+    """
+    Protected Function
+    Dense coefficient array, modulo p, of the determinant of a
+    polynomial matrix.
+
+    Parameters
+    ----------
+    terms : list
+        One (row, col, coefficients, exponents) tuple per non-zero
+        entry, where exponents is an (n_terms, n_active) int array over
+        the active variables.
+    m : int
+        Size of the (square) matrix.
+    degrees : tuple
+        Bound on the span of the determinant's degrees in each active
+        variable.
+    lows : tuple
+        Lowest degree of the determinant in each active variable,
+        divided out of its values.
+    p : int
+        Prime modulus.
+    chunk_size : int
+        Number of evaluation points held in memory at once.
+
+    Returns
+    -------
+    coeffs : numpy.ndarray
+        Array of shape (d + 1 for d in degrees) whose entry at index
+        (e_1, ..., e_v) is the coefficient of the monomial with
+        exponents (lows[0] + e_1, ..., lows[-1] + e_v), modulo p.
+
+    """
+    shape = tuple(d + 1 for d in degrees)
+    # Evaluation points 1, ..., d + 1 in each variable, with power tables
+    # up to the entries' highest exponents
+    tops = np.max([e.max(axis = 0) for _, _, _, e in terms], axis = 0) if shape else ()
+    powers = [_pow_table(np.arange(1, s + 1, dtype = np.int64), int(top), p) for s, top in zip(shape, tops)]
+    # Inverse of each point to its variable's lowest degree
+    shifts = [_pow_mod(_pow_mod(np.arange(1, s + 1, dtype = np.int64), p - 2, p), low, p)
+              for s, low in zip(shape, lows)]
+    terms = [(i, j, np.asarray(c, dtype = object) % p, e) for i, j, c, e in terms]
+
+    total = prod(shape)
+    values = np.empty(total, dtype = np.int64)
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        coords = np.unravel_index(flat, shape) if shape else ()
+        A = np.zeros((len(flat), m, m), dtype = np.int64)
+        for i, j, coeffs, exps in terms:
+            entry = np.zeros(len(flat), dtype = np.int64)
+            for c, e in zip(coeffs, exps):
+                v = np.full(len(flat), int(c), dtype = np.int64)
+                for axis, power in enumerate(e):
+                    if power:
+                        v = v * powers[axis][power, coords[axis]] % p
+                entry = (entry + v) % p
+            A[:, i, j] = entry
+        det = _batched_det_mod(A, p)
+        for axis, shift in enumerate(shifts):
+            det = det * shift[coords[axis]] % p
+        values[flat] = det
+
+    # Interpolate one variable at a time
+    coeffs = values.reshape(shape)
+    for axis, s in enumerate(shape):
+        inv = _inverse_vandermonde(list(range(1, s + 1)), p)
+        vals = np.moveaxis(coeffs, axis, 0)
+        out = np.zeros_like(vals)
+        for i in range(s):
+            out = (out + inv[:, i].reshape((s,) + (1,) * (vals.ndim - 1)) * vals[i]) % p
+        coeffs = np.moveaxis(out, 0, axis)
+    return coeffs
+
+
+def _assignment(cost):
+    """
+    Protected Function
+    Least total cost of a permutation of a square cost matrix, by the
+    Hungarian algorithm, or None if every permutation meets a None
+    (forbidden) entry.
+    """
+    n = len(cost)
+    big = 1 + sum(abs(c) for row in cost for c in row if c is not None)
+    a = [[big if c is None else c for c in row] for row in cost]
+
+    # Potentials u, v and the row matched to each column, 1-based
+    u = [0] * (n + 1)
+    v = [0] * (n + 1)
+    match = [0] * (n + 1)
+    way = [0] * (n + 1)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        slack = [float("inf")] * (n + 1)
+        used = [False] * (n + 1)
+        while match[j0]:
+            used[j0] = True
+            i0 = match[j0]
+            delta = float("inf")
+            j1 = 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    c = a[i0 - 1][j - 1] - u[i0] - v[j]
+                    if c < slack[j]:
+                        slack[j] = c
+                        way[j] = j0
+                    if slack[j] < delta:
+                        delta = slack[j]
+                        j1 = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    slack[j] -= delta
+            j0 = j1
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    if any(cost[match[j] - 1][j - 1] is None for j in range(1, n + 1)):
+        return None
+    return sum(cost[match[j] - 1][j - 1] for j in range(1, n + 1))
+
+
+def _pow_table(points, d, p):
+    """
+    Protected Function
+    Table T[e, i] = points[i]**e mod p for e = 0, ..., d.
+    """
+    table = np.ones((d + 1, len(points)), dtype = np.int64)
+    for e in range(1, d + 1):
+        table[e] = table[e - 1] * points % p
+    return table
+
+
+def modular_det(mat, jobs = None, chunk_size = 4096, max_points = 2**16, fallback = False):
+    """
+    Determinant of a square Laurent_Matrix by evaluation/interpolation
+    modulo word-sized primes and Chinese remainder reconstruction.
+
+    Parameters
+    ----------
+    mat : Laurent_Matrix
+        The (square) matrix.
+    jobs : int or None (Default = None)
+        Number of worker processes to spread the primes over. None, or
+        1, computes every prime in this process.
+    chunk_size : int (Default = 4096)
+        Number of evaluation points whose matrices are held in memory
+        at once.
+    max_points : int or None (Default = 2**16)
+        Largest interpolation grid, in points per prime, or None for no
+        limit.
+    fallback : boolean (Default = False)
+        Takes the determinant by Laurent_Matrix.det(), in this process,
+        when the grid exceeds max_points, instead of raising.
+
+    Returns
+    -------
+    det : dict
+        The determinant as a polynomial of the matrix's ring.
+
+    Raises
+    ------
+    ValueError
+        If the grid exceeds max_points and fallback is not set.
+
+    Notes
+    -----
+    Denominators are cleared row by row first. Every term of the
+    determinant is a product of entries along a permutation, so its
+    highest and lowest degree in each variable are bounded by the
+    heaviest and the lightest permutation of the entries' highest and
+    lowest degrees, found by the Hungarian algorithm. Only the degrees
+    in between are interpolated, on a dense grid of prod(span + 1)
+    points per prime, and that grid, for every prime, is held in
+    memory. The size of its coefficients is bounded by the product of
+    the rows' coefficient 1-norms, which fixes how many primes are
+    needed.
+
+    The grid grows with the product of the spans over every variable,
+    while Bareiss elimination grows with the number of terms actually
+    present, and the grid is mostly zeros once there are several strand
+    classes. In a single process Bareiss is usually the faster of the
+    two; the modular method is for dense determinants in few variables,
+    with the primes spread over several jobs. max_points bounds the
+    time and the memory held per prime.
+
+    """
+    ring = mat.ring
+    m, m2 = mat.shape
+    if m != m2:
+        raise ValueError("Determinant requires a square matrix.")
+    if m == 0:
+        return ring.one()
+
+    cleared, key = mat.clear_denominators()
+    nvars = len(ring.variables)
+
+    # Entries as coefficient and exponent arrays
+    entries = []
+    for i, row in enumerate(cleared.rows):
+        for j, poly in enumerate(row):
+            if poly:
+                exps = np.array([ring.unpack(k) for k in poly], dtype = np.int64).reshape(len(poly), nvars)
+                entries.append((i, j, list(poly.values()), exps))
+    if not entries:
+        return {}
+
+    # Degree bounds from the heaviest and lightest permutations
+    tops = [[None] * m for _ in range(m)]
+    bottoms = [[None] * m for _ in range(m)]
+    for i, j, _, exps in entries:
+        tops[i][j] = exps.max(axis = 0)
+        bottoms[i][j] = exps.min(axis = 0)
+    highs = []
+    lows = []
+    for v in range(nvars):
+        high = _assignment([[None if e is None else -int(e[v]) for e in row] for row in tops])
+        if high is None:
+            # No permutation avoids a zero entry
+            return {}
+        highs.append(-high)
+        lows.append(_assignment([[None if e is None else int(e[v]) for e in row] for row in bottoms]))
+    active = [v for v in range(nvars) if highs[v] > lows[v]]
+    degrees = tuple(highs[v] - lows[v] for v in active)
+    points = prod(d + 1 for d in degrees)
+    if max_points is not None and points > max_points:
+        if fallback:
+            return mat.det()
+        raise ValueError("Interpolation grid of " + str(points) + " points exceeds max_points = " + str(max_points)
+                         + ", use the Bareiss determinant or pass fallback = True.")
+    # Variables of a single degree are evaluated at 1
+    terms = [(i, j, c, e[:, active]) for i, j, c, e in entries]
+
+    # Coefficient bound and the primes it needs
+    norms = [0] * m
+    for i, _, c, _ in entries:
+        norms[i] += sum(abs(v) for v in c)
+    limit = 2 * prod(norms) + 1
+    primes = _primes(limit.bit_length() // 31 + 1)
+    while prod(primes) <= limit:
+        primes = _primes(len(primes) + 1)
+
+    args = [(terms, m, degrees, tuple(lows[v] for v in active), p, chunk_size) for p in primes]
+    if jobs is not None and jobs > 1:
+        with ProcessPoolExecutor(max_workers = jobs) as pool:
+            residues = list(pool.map(_det_mod_prime, *zip(*args)))
+    else:
+        residues = [_det_mod_prime(*a) for a in args]
+
+    # Chinese remaindering (Garner) on the non-zero coefficients only
+    nonzero = np.argwhere(np.any([r != 0 for r in residues], axis = 0))
+    det = {}
+    for index in map(tuple, nonzero):
+        x = int(residues[0][index])
+        M = primes[0]
+        for p, r in zip(primes[1:], residues[1:]):
+            t = (int(r[index]) - x) * pow(M, -1, p) % p
+            x += M * t
+            M *= p
+        if x > M // 2:
+            x -= M
+        if x:
+            exps = list(lows)
+            for v, e in zip(active, index):
+                exps[v] += int(e)
+            det[ring.pack(exps)] = x
+
+    # Divide out the row monomials
+    return ring.shift(det, 2*ring._offset - key)
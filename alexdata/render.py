@@ -0,0 +1,266 @@
+"""
+Braid Rendering
+===============
+Shared geometry engine behind Braid.draw() and Braid_Kernel.draw().
+
+The curve of a crossing is the same for every crossing up to a shift,
+so the two crossing templates are computed once, every crossing's
+vertices are produced in one vectorised step, and each strand is
+written into its own slice of a single preallocated vertex buffer.
+The whole braid is then drawn as one LineCollection.
+
+Figures for files and buffers are built without pyplot, on the Agg
+canvas, so rendering needs no display, leaves pyplot's global state
+alone and is safe to run concurrently. Such figures are never
+registered with pyplot, so they are freed as soon as they are dropped.
+
+"""
+
+# Dependent Libraries
+import io
+import os
+
+import numpy as np
+
+
+__all__ = [
+    "braid_geometry",
+    "frame_figure",
+    "layout",
+    "new_figure",
+    "save_figure",
+    "strand_collection",
+    "word_title"
+]
+
+
+# Parameter along one half of a crossing
+_T = np.arange(0, 1.05, 0.05)
+
+# Crossing templates, at position 0 and height 0, each half then the
+# other half reversed: the strand moving right and the strand moving
+# left.
+_RIGHT = np.concatenate([np.array([0.5*_T**2, -_T]).T, np.flipud(np.array([-0.5*_T**2 + 1, _T - 2]).T)])
+_LEFT = np.concatenate([np.array([-0.5*_T**2 + 1, -_T]).T, np.flipud(np.array([0.5*_T**2, _T - 2]).T)])
+
+
+def layout(ops, style = "comp"):
+    """
+    Depth of each crossing of a braid word in the figure.
+
+    Parameters
+    ----------
+    ops : sequence of int
+        Braid word.
+    style : "comp" or "ext" (Default = "comp")
+        "comp" places crossings on disjoint strands side by side, "ext"
+        puts every crossing on its own level.
+
+    Returns
+    -------
+    depths : numpy.ndarray
+        Depth at which each crossing starts.
+    height : int
+        Total depth of the braid.
+
+    """
+    depths = np.empty(len(ops), dtype = np.int64)
+    x = 0
+    layer = set()
+    for count, op in enumerate(ops):
+        i = abs(op)
+        if style == "comp":
+            if i in layer or i + 1 in layer:
+                layer = set()
+                x += 2
+            layer.update((i, i + 1))
+        depths[count] = x
+        if style == "ext" or count + 1 == len(ops):
+            x += 2
+    return depths, x
+
+
+def braid_geometry(n, ops, style = "comp", gap_size = 3, tails = None):
+    """
+    Vertices of every strand of a braid.
+
+    Parameters
+    ----------
+    n : int
+        Number of strands.
+    ops : sequence of int
+        Braid word.
+    style : "comp" or "ext" (Default = "comp")
+        Layout, see layout().
+    gap_size : int (Default = 3)
+        Number of vertices left out on each side of a crossing for the
+        undercrossing strand.
+    tails : callable or None (Default = None)
+        tails(position, height) returns the vertices that end the strand
+        at the given bottom position (1, ..., n). By default each strand
+        ends straight at the bottom of the braid.
+
+    Returns
+    -------
+    paths : list
+        (m, 2) array of vertices for the strand ending at each bottom
+        position, with rows of NaNs where it passes under another strand.
+        The arrays are views into one shared buffer.
+    height : int
+        Total depth of the braid.
+
+    """
+    ops = np.asarray(ops, dtype = np.int64).reshape(-1)
+    L = len(ops)
+    depths, height = layout(ops.tolist(), style)
+    if tails is None:
+        tails = lambda position, height: np.array([[position, -height]], dtype = float)
+
+    # Every crossing's two curves at once
+    i = np.abs(ops)
+    offsets = np.stack([i, -depths], axis = 1).astype(float)
+    right = _RIGHT[None] + offsets[:, None]
+    left = _LEFT[None] + offsets[:, None]
+    if gap_size > 0:
+        mid = len(_T)
+        gap = slice(mid - gap_size, mid + gap_size)
+        right[ops < 0, gap] = np.nan
+        left[ops > 0, gap] = np.nan
+
+    # The strand, named by its top position, taking each curve
+    at = np.arange(n)
+    owner = np.empty((2, L), dtype = np.int64)
+    for c, g in enumerate(i.tolist()):
+        owner[0, c] = at[g - 1]
+        owner[1, c] = at[g]
+        at[g - 1], at[g] = at[g], at[g - 1]
+
+    # Curves grouped by strand, in crossing order
+    curves = np.concatenate([right, left])
+    owners = owner.reshape(-1)
+    order = np.lexsort((np.tile(np.arange(L), 2), owners))
+    curves = curves[order]
+    counts = np.bincount(owners, minlength = n)
+    first = np.concatenate([[0], np.cumsum(counts)])
+
+    # One buffer: start, curves and tail of each strand in turn
+    ends = [tails(p + 1, height) for p in range(n)]
+    size = [1 + counts[at[p]] * len(_RIGHT) + len(ends[p]) for p in range(n)]
+    buffer = np.empty((sum(size), 2))
+    paths = []
+    row = 0
+    for p in range(n):
+        s = at[p]
+        path = buffer[row:row + size[p]]
+        path[0] = (s + 1, 0)
+        path[1:-len(ends[p])] = curves[first[s]:first[s + 1]].reshape(-1, 2)
+        path[-len(ends[p]):] = ends[p]
+        paths.append(path)
+        row += size[p]
+    return paths, height
+
+
+def strand_collection(paths, colors, linewidth = 3):
+    """
+    Single LineCollection drawing every strand.
+
+    Parameters
+    ----------
+    paths : list
+        Vertices of each strand, with NaN rows at breaks, see
+        braid_geometry().
+    colors : list
+        Matplotlib colour of each strand.
+    linewidth : int (Default = 3)
+        Thickness of the strands.
+
+    Returns
+    -------
+    lines : matplotlib.collections.LineCollection
+        The strands, split into unbroken segments.
+
+    """
+    from matplotlib.collections import LineCollection
+
+    segments = []
+    segment_colors = []
+    for path, color in zip(paths, colors):
+        valid = ~np.isnan(path[:, 0])
+        edges = np.flatnonzero(np.diff(np.concatenate([[False], valid, [False]]).astype(np.int8)))
+        for a, b in zip(edges[::2], edges[1::2]):
+            segments.append(path[a:b])
+            segment_colors.append(color)
+    return LineCollection(segments, colors = segment_colors, linewidths = linewidth, capstyle = "projecting")
+
+
+def word_title(ops, limit = 8):
+    """
+    Title text of a braid word, abbreviated past 'limit' operations to
+    its first and last few, with its length on a second line.
+    """
+    ops = [int(op) for op in ops]
+    if len(ops) <= limit:
+        return str(ops)
+    head = ", ".join(str(op) for op in ops[:limit // 2])
+    tail = ", ".join(str(op) for op in ops[-(limit // 2):])
+    return "[" + head + ", ..., " + tail + "]\n(" + str(len(ops)) + " crossings)"
+
+
+def frame_figure(fig, title):
+    """
+    Titles a figure and sets fixed margins around its axes.
+
+    Notes
+    -----
+    Fixed margins replace tight_layout(), which draws the whole figure
+    to measure it, doubling the cost of rendering long braids.
+
+    """
+    lines = title.count("\n") + 1
+    fig.suptitle(title)
+    top = 1 - (0.25 + 0.2*lines) / fig.get_figheight()
+    fig.subplots_adjust(left = 0.02, right = 0.98, bottom = 0.02, top = top)
+
+
+def new_figure(figsize):
+    """
+    MatPlotLib figure on an Agg canvas, unknown to pyplot.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize = figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def save_figure(fig, target = None, format = None, dpi = 100):
+    """
+    Saves a figure to a path or file object, or encodes it as bytes.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        The figure, see new_figure().
+    target : str, os.PathLike, file object or None (Default = None)
+        Where to write the image. None returns it as bytes.
+    format : str or None (Default = None)
+        Image format, taken from the path's suffix if not given,
+        otherwise "png".
+    dpi : int (Default = 100)
+        Resolution of raster formats.
+
+    Returns
+    -------
+    image : bytes or None
+        The encoded image if no target was given.
+
+    """
+    if format is None:
+        suffix = os.path.splitext(os.fspath(target))[1] if isinstance(target, (str, os.PathLike)) else ""
+        format = suffix[1:].lower() or "png"
+    if target is None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format = format, dpi = dpi)
+        return buffer.getvalue()
+    fig.savefig(target, format = format, dpi = dpi)
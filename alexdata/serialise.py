@@ -0,0 +1,424 @@
+"""
+Serialisation
+=============
+Array form of kernels and of the invariants computed from them, for
+storage, and for readers without SymPy.
+
+Everything is encoded as a flat dict of NumPy arrays, keyed by
+"<prefix>.<field>", which can be saved as is with numpy.savez (or as a
+directory of .npy files that can be memory-mapped) and maps directly
+onto Arrow/Parquet columns:
+
+Kernel, prefix "kernel"
+    shape : int32 [n, k]
+    word : int16 or int32, the braid word
+
+Polynomial
+    variables : unicode, variable names
+    exponents : int8, int16 or int32 (terms, variables), the narrowest
+        that holds every exponent
+    coefficients : int64, or decimal strings if any does not fit
+
+Matrix, a sparse polynomial matrix
+    shape : int32 [rows, columns]
+    rows, cols : int32 (terms,), the entry each term belongs to
+    variables, exponents, coefficients : as a polynomial
+
+Laurent polynomials are stored exactly, negative exponents included.
+Only integer coefficients are supported.
+
+Result sets
+    stack() stores many records, each a dict of arrays as above, in
+    one columnar dict: every field of every record concatenated
+    (flattened, for 2-d fields), with
+    <field>.offsets : int64 (records + 1,), where each record's slice
+        of the field starts and ends
+    <field>.dims : int64 (records, 2), shape of a 2-d field per record
+    records.valid : bool (records,), False for missing records
+    record() reads one record back as views of the columns, so a saved
+    set can be memory-mapped and read record by record.
+
+The array form of a single small result is often larger than its
+pickle; the gain is in exactness, in independence from SymPy, and in
+storing large result sets column by column.
+
+"""
+
+# Dependent Libraries
+import os
+
+import numpy as np
+
+from ._lazy import sp
+from .laurent import Laurent_Matrix
+
+
+__all__ = [
+    "decode_kernel",
+    "decode_matrix",
+    "decode_polynomial",
+    "decode_result",
+    "decode_results",
+    "encode_kernel",
+    "encode_matrix",
+    "encode_polynomial",
+    "encode_result",
+    "encode_results",
+    "load",
+    "record",
+    "save",
+    "stack"
+]
+
+
+# Key of the mask of present records in a stacked result set
+_VALID = "records.valid"
+
+
+def _coefficient_array(coeffs):
+    """
+    Protected Function
+    int64 array of integer coefficients, or decimal strings if any is
+    too large.
+    """
+    coeffs = [int(c) for c in coeffs]
+    if all(-2**63 <= c < 2**63 for c in coeffs):
+        return np.array(coeffs, dtype = np.int64)
+    return np.array([str(c) for c in coeffs])
+
+
+def _coefficients(array):
+    """
+    Protected Function
+    Python int coefficients of a coefficient array.
+    """
+    return [int(c) for c in array.tolist()]
+
+
+def _sympy_terms(expr):
+    """
+    Protected Function
+    (exponent dict, coefficient) of every term of an expanded SymPy
+    Laurent polynomial.
+    """
+    terms = []
+    for term in sp.Add.make_args(sp.expand(expr)):
+        if term == 0:
+            continue
+        coeff, monomial = term.as_coeff_Mul()
+        if not coeff.is_Integer:
+            raise ValueError("Only polynomials with integer coefficients can be serialised, got " + str(term) + ".")
+        powers = {}
+        for base, e in monomial.as_powers_dict().items():
+            if base == 1:
+                continue
+            if not base.is_Symbol or not e.is_Integer:
+                raise ValueError("Not a Laurent polynomial term: " + str(term) + ".")
+            powers[base.name] = int(e)
+        terms.append((powers, int(coeff)))
+    return terms
+
+
+def _pack(prefix, variables, exponents, coeffs, out):
+    """
+    Protected Function
+    Stores the variables, exponents and coefficients blocks.
+    """
+    exponents = np.array(exponents, dtype = np.int32).reshape(len(coeffs), len(variables))
+    for dtype in (np.int8, np.int16):
+        info = np.iinfo(dtype)
+        if exponents.size == 0 or (info.min <= exponents.min() and exponents.max() <= info.max):
+            exponents = exponents.astype(dtype)
+            break
+    out[prefix + ".variables"] = np.array(variables, dtype = str).reshape(-1)
+    out[prefix + ".exponents"] = exponents
+    out[prefix + ".coefficients"] = _coefficient_array(coeffs)
+
+
+def encode_kernel(kernel, prefix = "kernel"):
+    """
+    Array form of a Braid_Kernel: its braid group, caps and word.
+    """
+    return {prefix + ".shape": np.array([kernel.braid_group, kernel.caps], dtype = np.int32),
+            prefix + ".word": np.array(kernel.word)}
+
+
+def decode_kernel(arrays, prefix = "kernel"):
+    """
+    Braid_Kernel from its array form, built around the stored word.
+    """
+    from .alexdata import Braid_Kernel
+
+    n, k = (int(v) for v in arrays[prefix + ".shape"])
+    return Braid_Kernel.from_array(n, k, np.ascontiguousarray(arrays[prefix + ".word"]))
+
+
+def encode_polynomial(poly, prefix = "polynomial", ring = None):
+    """
+    Array form of a polynomial.
+
+    Parameters
+    ----------
+    poly : SymPy expression or dict
+        A Laurent polynomial with integer coefficients, or a polynomial
+        of a Laurent_Ring.
+    prefix : str (Default = "polynomial")
+        Prefix of the arrays' keys.
+    ring : Laurent_Ring or None (Default = None)
+        Ring of a dict polynomial.
+
+    Returns
+    -------
+    arrays : dict
+        The polynomial's variables, exponents and coefficients.
+
+    """
+    out = {}
+    if isinstance(poly, dict):
+        if ring is None:
+            raise ValueError("A ring is needed to encode a dict polynomial.")
+        _pack(prefix, ring.variables, [ring.unpack(key) for key in poly], list(poly.values()), out)
+        return out
+
+    terms = _sympy_terms(poly)
+    variables = sorted({v for powers, _ in terms for v in powers})
+    exponents = [[powers.get(v, 0) for v in variables] for powers, _ in terms]
+    _pack(prefix, variables, exponents, [c for _, c in terms], out)
+    return out
+
+
+def decode_polynomial(arrays, prefix = "polynomial"):
+    """
+    SymPy expression of a polynomial's array form.
+    """
+    gens = [sp.Symbol(v) for v in arrays[prefix + ".variables"].tolist()]
+    exponents = arrays[prefix + ".exponents"].tolist()
+    coeffs = _coefficients(arrays[prefix + ".coefficients"])
+    return sp.Add(*[sp.Integer(c) * sp.Mul(*[g**e for g, e in zip(gens, exps) if e]) for exps, c in zip(exponents, coeffs)])
+
+
+def encode_matrix(mat, prefix = "matrix"):
+    """
+    Sparse array form of a SymPy Matrix or a Laurent_Matrix of Laurent
+    polynomials, see the module notes.
+    """
+    out = {}
+    rows, cols, exponents, coeffs = [], [], [], []
+    if isinstance(mat, Laurent_Matrix):
+        ring = mat.ring
+        variables = list(ring.variables)
+        for i, row in enumerate(mat.rows):
+            for j, poly in enumerate(row):
+                for key, c in poly.items():
+                    rows.append(i)
+                    cols.append(j)
+                    exponents.append(ring.unpack(key))
+                    coeffs.append(c)
+    else:
+        entries = {}
+        for i in range(mat.rows):
+            for j in range(mat.cols):
+                if mat[i, j] != 0:
+                    entries[i, j] = _sympy_terms(mat[i, j])
+        variables = sorted({v for terms in entries.values() for powers, _ in terms for v in powers})
+        for (i, j), terms in entries.items():
+            for powers, c in terms:
+                rows.append(i)
+                cols.append(j)
+                exponents.append([powers.get(v, 0) for v in variables])
+                coeffs.append(c)
+
+    out[prefix + ".shape"] = np.array(mat.shape, dtype = np.int32)
+    out[prefix + ".rows"] = np.array(rows, dtype = np.int32)
+    out[prefix + ".cols"] = np.array(cols, dtype = np.int32)
+    _pack(prefix, variables, exponents, coeffs, out)
+    return out
+
+
+def decode_matrix(arrays, prefix = "matrix"):
+    """
+    SymPy Matrix of a matrix's array form.
+    """
+    m, n = (int(v) for v in arrays[prefix + ".shape"])
+    gens = [sp.Symbol(v) for v in arrays[prefix + ".variables"].tolist()]
+    entries = {}
+    terms = zip(arrays[prefix + ".rows"].tolist(), arrays[prefix + ".cols"].tolist(),
+                arrays[prefix + ".exponents"].tolist(), _coefficients(arrays[prefix + ".coefficients"]))
+    for i, j, exps, c in terms:
+        entries.setdefault((i, j), []).append(sp.Integer(c) * sp.Mul(*[g**e for g, e in zip(gens, exps) if e]))
+    mat = sp.zeros(m, n)
+    for (i, j), cell in entries.items():
+        mat[i, j] = sp.Add(*cell)
+    return mat
+
+
+def encode_result(stage, result):
+    """
+    Array form of the result of a pipeline stage, see batch.STAGES.
+    """
+    if stage == "labels":
+        labels = np.array(result["undercrossing_labels"], dtype = np.int32)
+        strands = [s for g in result["eq"] for s in g]
+        return {"labels.undercrossing": labels,
+                "labels.eq_sizes": np.array([len(g) for g in result["eq"]], dtype = np.int32),
+                "labels.eq": np.array(strands, dtype = np.int32).reshape(len(strands), 2)}
+    if stage == "burau":
+        return encode_matrix(result, "burau")
+    if stage == "polynomial":
+        return encode_polynomial(result, "polynomial")
+    if stage == "data":
+        out = encode_polynomial(result["U"], "U")
+        out.update(encode_polynomial(result["V"], "V"))
+        out.update(encode_matrix(result["data"], "data"))
+        return out
+    raise ValueError("Unknown stage '" + str(stage) + "'.")
+
+
+def decode_result(stage, arrays):
+    """
+    Result of a pipeline stage from its array form, as returned by
+    batch.compute() (SymPy objects rather than Laurent_Matrix).
+    """
+    if stage == "labels":
+        strands = [tuple(s) for s in arrays["labels.eq"].tolist()]
+        eq = []
+        start = 0
+        for size in arrays["labels.eq_sizes"].tolist():
+            eq.append(tuple(strands[start:start + size]))
+            start += size
+        return {"undercrossing_labels": arrays["labels.undercrossing"].tolist(), "eq": tuple(eq)}
+    if stage == "burau":
+        return decode_matrix(arrays, "burau")
+    if stage == "polynomial":
+        return decode_polynomial(arrays, "polynomial")
+    if stage == "data":
+        return {"U": decode_polynomial(arrays, "U"), "V": decode_polynomial(arrays, "V"),
+                "data": decode_matrix(arrays, "data")}
+    raise ValueError("Unknown stage '" + str(stage) + "'.")
+
+
+def _concatenate(parts):
+    """
+    Protected Function
+    Concatenates flat arrays, as decimal strings if numbers and strings
+    are mixed, as in coefficient arrays.
+    """
+    kinds = {p.dtype.kind for p in parts if len(p)}
+    if "U" in kinds and len(kinds) > 1:
+        parts = [p.astype(str) for p in parts]
+    if not parts:
+        return np.zeros(0, dtype = np.int64)
+    return np.concatenate(parts)
+
+
+def stack(records):
+    """
+    Stores many records in one columnar dict of arrays.
+
+    Parameters
+    ----------
+    records : iterable
+        Dicts of arrays, as returned by encode_result(), or None for a
+        missing record.
+
+    Returns
+    -------
+    arrays : dict
+        The columns, see the module notes; save() it as any other dict
+        of arrays.
+
+    """
+    records = list(records)
+    keys = sorted({key for r in records if r is not None for key in r})
+    out = {_VALID: np.array([r is not None for r in records], dtype = bool)}
+    for key in keys:
+        parts = []
+        dims = []
+        for r in records:
+            array = np.asarray(r[key]) if r is not None and key in r else None
+            dims.append(array.shape if array is not None and array.ndim == 2 else (0, 0))
+            parts.append(np.zeros(0, dtype = np.int8) if array is None else array.reshape(-1))
+        out[key] = _concatenate(parts)
+        out[key + ".offsets"] = np.concatenate([[0], np.cumsum([len(p) for p in parts])]).astype(np.int64)
+        if any(r is not None and key in r and np.ndim(r[key]) == 2 for r in records):
+            out[key + ".dims"] = np.array(dims, dtype = np.int64).reshape(-1, 2)
+    return out
+
+
+def record(arrays, index):
+    """
+    Dict of arrays of one record of a stacked result set, as views of
+    its columns, or None if the record is missing.
+    """
+    if not arrays[_VALID][index]:
+        return None
+    out = {}
+    for key in arrays:
+        if key == _VALID or key.endswith(".offsets") or key.endswith(".dims"):
+            continue
+        start, stop = (int(v) for v in arrays[key + ".offsets"][index:index + 2])
+        column = arrays[key][start:stop]
+        if key + ".dims" in arrays:
+            column = column.reshape(tuple(int(v) for v in arrays[key + ".dims"][index]))
+        out[key] = column
+    return out
+
+
+def encode_results(stage, results):
+    """
+    Stacked array form of many results of a pipeline stage, None for
+    missing ones, see stack().
+    """
+    return stack(None if result is None else encode_result(stage, result) for result in results)
+
+
+def decode_results(stage, arrays):
+    """
+    Yields each result of a stacked result set, or None for missing
+    ones, see decode_result().
+    """
+    for index in range(len(arrays[_VALID])):
+        arrays_i = record(arrays, index)
+        yield None if arrays_i is None else decode_result(stage, arrays_i)
+
+
+def save(path, arrays, compress = True):
+    """
+    Saves a dict of arrays to an .npz file or, if path is an existing
+    directory or ends in a separator, to one .npy file per array.
+
+    Notes
+    -----
+    Arrays saved to a directory can be memory-mapped by load(). Every
+    array is plain numeric or unicode, so no pickling is involved.
+
+    """
+    path = os.fspath(path)
+    if os.path.isdir(path) or path.endswith(os.sep):
+        os.makedirs(path, exist_ok = True)
+        for key, array in arrays.items():
+            np.save(os.path.join(path, key + ".npy"), array, allow_pickle = False)
+    elif compress:
+        np.savez_compressed(path, **arrays)
+    else:
+        np.savez(path, **arrays)
+
+
+def load(path, mmap_mode = None):
+    """
+    Loads a dict of arrays saved by save().
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        An .npz file or a directory of .npy files.
+    mmap_mode : None or "r", "r+", "c" (Default = None)
+        Memory-maps the arrays of a directory, see numpy.load().
+
+    """
+    path = os.fspath(path)
+    if os.path.isdir(path):
+        return {name[:-4]: np.load(os.path.join(path, name), mmap_mode = mmap_mode, allow_pickle = False)
+                for name in sorted(os.listdir(path)) if name.endswith(".npy")}
+    with np.load(path, allow_pickle = False) as f:
+        return {key: f[key] for key in f.files}
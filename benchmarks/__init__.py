@@ -0,0 +1,13 @@
+"""
+AlexanderData Benchmarks
+========================
+Reproducible timings of every stage of the Braid_Kernel pipeline over
+a seeded grid of random kernels.
+
+Run from the repository root with:
+```
+python -m benchmarks --output results.json
+python -m benchmarks --compare results.json --output new.json
+```
+
+"""
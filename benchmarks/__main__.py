@@ -0,0 +1,61 @@
+"""
+Command line entry point of the benchmark suite, see
+python -m benchmarks --help.
+"""
+
+# Dependent Libraries
+import argparse
+import json
+
+from .suite import STAGES, compare, grid, run
+
+
+def _ints(text):
+    return tuple(int(v) for v in text.split(","))
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks",
+                                     description = "Times every Braid_Kernel pipeline stage over a seeded kernel grid.")
+    parser.add_argument("--strands", type = _ints, default = (5, 7, 9), help = "braid groups, e.g. 5,7,9")
+    parser.add_argument("--caps", type = _ints, default = (1, 2), help = "numbers of caps, e.g. 1,2")
+    parser.add_argument("--lengths", type = _ints, default = (10, 20, 40), help = "word lengths, e.g. 10,20,40")
+    parser.add_argument("--samples", type = int, default = 1, help = "random kernels per grid point")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--stages", type = lambda s: tuple(s.split(",")), default = tuple(STAGES),
+                        help = "comma separated stages, from " + ",".join(STAGES))
+    parser.add_argument("--repeat", type = int, default = 3, help = "timed runs per measurement")
+    parser.add_argument("--budget", type = float, default = 30,
+                        help = "seconds a single run may take; overrunning stages are skipped for larger cases")
+    parser.add_argument("--output", help = "JSON file to save the results to")
+    parser.add_argument("--compare", help = "JSON results of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    cases = grid(args.strands, args.caps, args.lengths, args.samples, args.seed)
+
+    def log(r):
+        if r.get("skipped"):
+            print(f"{r['case']:<16} {r['stage']:<20} skipped")
+        elif r.get("timeout"):
+            print(f"{r['case']:<16} {r['stage']:<20} timed out after {r['budget']}s")
+        elif r.get("error"):
+            print(f"{r['case']:<16} {r['stage']:<20} failed: {r['error']}")
+        else:
+            print(f"{r['case']:<16} {r['stage']:<20} {r['seconds']:10.4f}s {r['peak_bytes'] / 2**20:9.2f}MiB {r['size']:8d}")
+
+    results = run(cases, args.stages, args.repeat, args.budget, log)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent = 1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print()
+        print(f"{'case':<16} {'stage':<20} {'time':>8} {'memory':>8}")
+        for case, stage, t, m in compare(old, results):
+            print(f"{case:<16} {stage:<20} {t:8.2f}x {m:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
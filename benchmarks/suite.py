@@ -0,0 +1,294 @@
+"""
+Benchmark Suite
+===============
+Seeded kernel grid, the stages measured on it, and the measurements:
+wall time, peak traced memory and size of the resulting expression.
+
+"""
+
+# Dependent Libraries
+import gc
+import platform
+import random
+import signal
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+import alexdata
+from alexdata import Braid_Kernel
+from alexdata.laurent import Laurent_Matrix
+
+
+__all__ = [
+    "EXAMPLE",
+    "STAGES",
+    "compare",
+    "environment",
+    "grid",
+    "run"
+]
+
+
+# The __main__ example of alexdata.alexdata, (n, k, ops)
+EXAMPLE = (5, 1, (3, 2, 2, -4, -1, -1, -2, -3, -4))
+
+
+def _kernel(spec):
+    n, k, ops = spec
+    return Braid_Kernel(n, k, *ops)
+
+
+# Each stage runs on a freshly built kernel, so cached stages are never reused
+STAGES = {
+    "track": lambda spec: _kernel(spec),
+    "burau": lambda spec: _kernel(spec).reduced_burau(print_result = False),
+    "burau_laurent": lambda spec: _kernel(spec).reduced_burau(print_result = False, backend = "laurent", inplace = True),
+    "polynomial": lambda spec: _kernel(spec).alexander_polynomial(print_result = False),
+    "polynomial_bareiss": lambda spec: _kernel(spec).alexander_polynomial(print_result = False, method = "bareiss"),
+    "polynomial_modular": lambda spec: _kernel(spec).alexander_polynomial(print_result = False, method = "modular"),
+    "data": lambda spec: _kernel(spec).alexander_data(print_result = False, method = "bareiss"),
+    "data_truncated": lambda spec: _kernel(spec).alexander_data(print_result = False, method = "bareiss", truncate = True),
+    "render": lambda spec: _kernel(spec).render(dpi = 40),
+}
+
+
+def grid(strands = (5, 7, 9), caps = (1, 2), lengths = (10, 20, 40), samples = 1, seed = 0):
+    """
+    Seeded random kernel specs over a grid, after the __main__ example.
+
+    Parameters
+    ----------
+    strands : tuple (Default = (5, 7, 9))
+        Braid groups.
+    caps : tuple (Default = (1, 2))
+        Numbers of caps; those that do not leave a loop strand are
+        skipped.
+    lengths : tuple (Default = (10, 20, 40))
+        Braid word lengths.
+    samples : int (Default = 1)
+        Random kernels per grid point.
+    seed : int (Default = 0)
+        Seed of the word generator.
+
+    Returns
+    -------
+    cases : list
+        (name, (n, k, ops)) pairs, the example first.
+
+    """
+    rng = random.Random(seed)
+    cases = [("example", EXAMPLE)]
+    for n in strands:
+        for k in caps:
+            if 2*k >= n:
+                continue
+            for length in lengths:
+                for sample in range(samples):
+                    ops = tuple(rng.choice((1, -1)) * rng.randint(1, n - 1) for _ in range(length))
+                    name = "n" + str(n) + "_k" + str(k) + "_L" + str(length) + "_" + str(sample)
+                    cases.append((name, (n, k, ops)))
+    return cases
+
+
+def size(result):
+    """
+    Size of a stage's result: number of polynomial terms, or bytes for
+    images.
+    """
+    if result is None:
+        return 0
+    if isinstance(result, bytes):
+        return len(result)
+    if isinstance(result, Braid_Kernel):
+        return len(result.word)
+    if isinstance(result, Laurent_Matrix):
+        return sum(len(p) for row in result.rows for p in row)
+    if isinstance(result, tuple):
+        return sum(size(r) for r in result)
+
+    import sympy as sp
+    if isinstance(result, sp.MatrixBase):
+        return sum(size(e) for e in result)
+    return len(sp.Add.make_args(sp.expand(result)))
+
+
+class _Timeout(Exception):
+    """
+    Raised inside a run that exceeds its time budget.
+    """
+
+
+def _on_alarm(signum, frame):
+    raise _Timeout()
+
+
+def _limited(fn, spec, budget):
+    """
+    Protected Function
+    Runs fn(spec), interrupted after 'budget' seconds if not None.
+    """
+    if budget is None:
+        return fn(spec)
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, budget)
+    try:
+        return fn(spec)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def measure(stage, spec, repeat = 3, budget = None):
+    """
+    Best wall time, peak traced memory and result size of a stage.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the stage, see STAGES.
+    spec : tuple
+        (n, k, ops) of the kernel.
+    repeat : int (Default = 3)
+        Timed runs.
+    budget : float or None (Default = None)
+        Seconds any single run may take. A run that overruns is
+        interrupted and no further runs are made.
+
+    Returns
+    -------
+    result : dict
+        "seconds", "peak_bytes" and "size", "timeout" set to True if a
+        run overran the budget, or "error" if the stage refused the
+        kernel, e.g. a modular grid beyond its limit.
+
+    Notes
+    -----
+    Times are taken without tracing, the best of 'repeat' runs; memory
+    is traced on one further run. The budget is enforced with a
+    real-time interval timer, so only on Unix and from the main thread.
+
+    """
+    fn = STAGES[stage]
+    times = []
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            result = _limited(fn, spec, budget)
+            times.append(time.perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            _limited(fn, spec, budget)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    except _Timeout:
+        return {"timeout": True, "budget": budget}
+    except ValueError as e:
+        return {"error": str(e)}
+    return {"seconds": min(times), "peak_bytes": peak, "size": size(result)}
+
+
+def environment():
+    """
+    Versions the results were taken with.
+    """
+    import matplotlib
+    import sympy
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output = True, text = True,
+                                cwd = alexdata.__path__[0]).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "sympy": sympy.__version__,
+        "matplotlib": matplotlib.__version__,
+        "commit": commit,
+    }
+
+
+def run(cases, stages = tuple(STAGES), repeat = 3, budget = None, log = None):
+    """
+    Measures every stage on every case.
+
+    Parameters
+    ----------
+    cases : list
+        (name, spec) pairs, see grid().
+    stages : tuple (Default = every stage)
+        Names of the stages to measure, see STAGES.
+    repeat : int (Default = 3)
+        Timed runs per measurement.
+    budget : float or None (Default = None)
+        Seconds any single run of a stage may take, see measure(). Once
+        a stage overruns it on a case, that case is recorded as timed
+        out and the stage is skipped on the later, larger, cases of the
+        same braid group.
+    log : callable or None (Default = None)
+        Called with each result as it is taken.
+
+    Returns
+    -------
+    results : dict
+        {"environment": ..., "results": [...]}, one result per case and
+        stage, ready to be saved as JSON.
+
+    """
+    for stage in stages:
+        if stage not in STAGES:
+            raise ValueError("Unknown stage '" + str(stage) + "', use one of " + str(tuple(STAGES)) + ".")
+
+    # Imports, and first use costs, are paid before anything is timed
+    for stage in stages:
+        STAGES[stage](EXAMPLE)
+
+    results = []
+    slow = set()
+    for name, spec in cases:
+        n, k, ops = spec
+        for stage in stages:
+            record = {"case": name, "stage": stage, "n": n, "k": k, "length": len(ops)}
+            if (stage, n) in slow:
+                record["skipped"] = True
+            else:
+                record.update(measure(stage, spec, repeat, budget))
+                if record.get("timeout"):
+                    slow.add((stage, n))
+            results.append(record)
+            if log is not None:
+                log(record)
+    return {"environment": environment(), "results": results}
+
+
+def compare(old, new):
+    """
+    Ratios, new over old, of the time and memory of every case and
+    stage measured in both runs.
+
+    Returns
+    -------
+    rows : list
+        (case, stage, time ratio, memory ratio) tuples.
+
+    """
+    def measured(r):
+        return not r.get("skipped") and not r.get("timeout") and not r.get("error")
+
+    before = {(r["case"], r["stage"]): r for r in old["results"] if measured(r)}
+    rows = []
+    for r in new["results"]:
+        b = before.get((r["case"], r["stage"]))
+        if b is None or not measured(r):
+            continue
+        rows.append((r["case"], r["stage"], r["seconds"] / max(b["seconds"], 1e-9),
+                     r["peak_bytes"] / max(b["peak_bytes"], 1)))
+    return rows
@@ -4,6 +4,7 @@ setup(
     name="alexdata",
     url = "https://github.com/RexGreenway/AlexanderData",
     packages=["alexdata"],
+    entry_points={"console_scripts": ["alexdata = alexdata.__main__:main"]},
     version="1.0.0",
     description="Package for the calculation of the Alexander Data, an invarinat for textiles.",
     author="Thomas Rex Greenway",
@@ -0,0 +1,71 @@
+"""
+Determinant regression tests: the Laurent engine's Bareiss determinant
+and the modular determinant must agree with SymPy on random kernels.
+"""
+
+# Dependent Libraries
+import random
+
+import pytest
+import sympy as sp
+
+from alexdata import Braid_Kernel
+from alexdata.laurent import Laurent_Ring
+from alexdata.modular import modular_det
+
+
+def _kernels(count, seed, max_strands = 6, max_length = 8):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(3, max_strands)
+        k = rng.randint(1, (n - 1) // 2)
+        ops = [rng.choice((1, -1)) * rng.randint(1, n - 1) for _ in range(rng.randint(1, max_length))]
+        yield Braid_Kernel(n, k, *ops)
+
+
+def test_bareiss_matches_sympy():
+    for kernel in _kernels(20, seed = 0):
+        M = kernel._alexander_matrix(backend = "laurent", inplace = True)
+        expected = M.to_sympy().det()
+        assert sp.cancel(M.ring.to_sympy(M.det()) - expected) == 0, kernel.braid_word
+
+
+def test_polynomial_methods_agree():
+    for kernel in _kernels(10, seed = 1):
+        expected = kernel.alexander_polynomial(print_result = False)
+        for method in ("bareiss", "modular"):
+            det = kernel.alexander_polynomial(print_result = False, method = method)
+            assert sp.cancel(det - expected) == 0, (method, kernel.braid_word)
+
+
+def test_modular_matches_bareiss():
+    for kernel in _kernels(40, seed = 2, max_strands = 7, max_length = 14):
+        M = kernel._alexander_matrix(backend = "laurent", inplace = True)
+        assert modular_det(M, max_points = None) == M.det(), kernel.braid_word
+
+
+def test_modular_fallback():
+    kernel = Braid_Kernel(7, 1, 3, 2, 5, -4, -1, -6, 2, -3, 4, 5, -2, 1, 6, 3)
+    M = kernel._alexander_matrix(backend = "laurent", inplace = True)
+    with pytest.raises(ValueError):
+        modular_det(M, max_points = 1)
+    assert modular_det(M, max_points = 1, fallback = True) == M.det()
+
+
+def test_truncated_matches_full():
+    for kernel in _kernels(10, seed = 3):
+        U, V, data = kernel.alexander_data(print_result = False, method = "bareiss")
+        kernel.clear_cache()
+        U_t, V_t, data_t = kernel.alexander_data(print_result = False, truncate = True)
+        assert (U, V) == (U_t, V_t)
+        assert (data - data_t).applyfunc(sp.expand).is_zero_matrix, kernel.braid_word
+
+
+def test_exquo():
+    ring = Laurent_Ring(["x", "t"])
+    p = ring.add(ring.gen("x"), ring.gen("t", -1, 2))
+    q = ring.sub(ring.gen("x", 2), ring.one())
+    assert ring.exquo(ring.mul(p, q), q) == p
+    assert ring.exquo(ring.mul(p, q), p) == q
+    with pytest.raises(ValueError):
+        ring.exquo(ring.add(ring.mul(p, q), ring.one()), q)
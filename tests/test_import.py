@@ -0,0 +1,41 @@
+"""
+Import-time regression tests: importing alexdata must stay cheap, and
+must not pull in SymPy or Matplotlib.
+"""
+
+# Dependent Libraries
+import json
+import os
+import subprocess
+import sys
+
+
+# Seconds 'import alexdata' may take in a fresh interpreter
+IMPORT_BUDGET = 1.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import alexdata
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "modules": sorted(sys.modules)}))
+"""
+
+
+def _probe():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH = root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run([sys.executable, "-c", _PROBE], capture_output = True, text = True, env = env, check = True)
+    return json.loads(out.stdout)
+
+
+def test_import_is_lazy():
+    modules = _probe()["modules"]
+    for heavy in ("sympy", "matplotlib"):
+        assert not any(m == heavy or m.startswith(heavy + ".") for m in modules), heavy + " imported by 'import alexdata'"
+
+
+def test_import_time_budget():
+    # Best of three, so a cold disk cache does not fail the test
+    seconds = min(_probe()["seconds"] for _ in range(3))
+    assert seconds < IMPORT_BUDGET, "'import alexdata' took " + format(seconds, ".2f") + "s"
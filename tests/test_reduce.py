@@ -0,0 +1,39 @@
+"""
+Word reduction regression tests: reduce() must shorten the braid word
+without changing the Alexander polynomial.
+"""
+
+# Dependent Libraries
+import random
+
+import sympy as sp
+
+from alexdata import Braid, Braid_Kernel
+
+
+def test_reduce_preserves_polynomial():
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(3, 6)
+        k = rng.randint(1, (n - 1) // 2)
+        ops = [rng.choice((1, -1)) * rng.randint(1, n - 1) for _ in range(rng.randint(2, 12))]
+        # Inverse pairs, some across far-commuting operations, to cancel
+        for _ in range(2):
+            i = rng.randint(0, len(ops))
+            op = rng.choice((1, -1)) * rng.randint(1, n - 1)
+            ops[i:i] = [op, -op]
+
+        kernel = Braid_Kernel(n, k, *ops)
+        expected = kernel.alexander_polynomial(print_result = False, method = "bareiss")
+        kernel.reduce()
+        assert len(kernel.braid_word) <= len(ops)
+        det = kernel.alexander_polynomial(print_result = False, method = "bareiss")
+        assert sp.expand(det - expected) == 0, ops
+
+
+def test_reduce_shrinkage():
+    braid = Braid(4, 1, 3, -1, 2, -2, -3)
+    braid.reduce()
+    assert braid.braid_word == []
+    assert braid.original_length == 6
+    assert braid.shrinkage == 1.0
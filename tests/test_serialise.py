@@ -0,0 +1,72 @@
+"""
+Serialisation regression tests: every stage's result must survive its
+array form, alone and stacked into a result set.
+"""
+
+# Dependent Libraries
+import random
+
+import numpy as np
+import sympy as sp
+
+from alexdata import Braid_Kernel, serialise
+from alexdata.batch import STAGES, _run_stage
+
+
+OPTIONS = {"labels": {}, "burau": {}, "polynomial": {"method": "bareiss"}, "data": {"method": "bareiss"}}
+
+
+def _specs(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(3, 6)
+        k = rng.randint(1, (n - 1) // 2)
+        yield n, k, tuple(rng.choice((1, -1)) * rng.randint(1, n - 1) for _ in range(rng.randint(1, 10)))
+
+
+def _equal(a, b):
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_equal(a[key], b[key]) for key in a)
+    if isinstance(a, sp.MatrixBase):
+        return a.shape == b.shape and (a - b).applyfunc(sp.expand).is_zero_matrix
+    if isinstance(a, sp.Basic):
+        return sp.expand(a - b) == 0
+    return a == b
+
+
+def test_result_round_trip():
+    for spec in _specs(10, seed = 0):
+        for stage in STAGES:
+            result = _run_stage(spec, stage, OPTIONS[stage])
+            assert _equal(serialise.decode_result(stage, serialise.encode_result(stage, result)), result), (stage, spec)
+
+
+def test_kernel_round_trip():
+    for n, k, ops in _specs(10, seed = 1):
+        kernel = Braid_Kernel(n, k, *ops)
+        decoded = serialise.decode_kernel(serialise.encode_kernel(kernel))
+        assert (decoded.braid_group, decoded.caps, decoded.braid_word) == (n, k, list(ops))
+
+
+def test_stacked_round_trip(tmp_path):
+    specs = list(_specs(6, seed = 2))
+    for stage in STAGES:
+        results = [_run_stage(spec, stage, OPTIONS[stage]) for spec in specs]
+        results[2] = None
+        arrays = serialise.encode_results(stage, results)
+        serialise.save(tmp_path / stage, arrays, compress = False)
+        for loaded in (arrays, serialise.load(str(tmp_path / stage) + ".npz")):
+            decoded = list(serialise.decode_results(stage, loaded))
+            assert len(decoded) == len(results)
+            for a, b in zip(decoded, results):
+                assert (a is None and b is None) or _equal(a, b), stage
+
+
+def test_stacked_memory_map(tmp_path):
+    results = [_run_stage(spec, "data", OPTIONS["data"]) for spec in _specs(4, seed = 3)]
+    path = str(tmp_path / "data") + "/"
+    serialise.save(path, serialise.encode_results("data", results))
+    arrays = serialise.load(path, mmap_mode = "r")
+    assert any(isinstance(a, np.memmap) for a in arrays.values())
+    for a, b in zip(serialise.decode_results("data", arrays), results):
+        assert _equal(a, b)